@@ -0,0 +1,206 @@
+import argparse
+import json
+import time
+import numpy as np
+import dearpygui.dearpygui as dpg
+from Benchmarks.SyntheticTicks import SyntheticTicks
+from FyersData.MarketPublisher import MarketPublisher
+from FyersData import RealTimeMarket
+from FyersData.RealTimeMarket import LiveDataTab
+from FyersData.StreamProcessor import StreamProcessor, StreamStage
+from FyersData.WireCodec import decode_message, get_codec
+from FyersData.ZmqReceiver import ZmqBatchReceiver
+from Utils.LatencyTracer import stamp, tracer
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def rss_mb():
+    """Peak resident set size of this process in MB, or None when it cannot be measured."""
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # ru_maxrss is in KB on Linux
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def percentiles_ms(samples_ns):
+    """p50/p95/p99 in milliseconds for a list of nanosecond samples."""
+    if not samples_ns:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    p50, p95, p99 = np.percentile(np.asarray(samples_ns, dtype=np.float64), [50, 95, 99]) / 1e6
+    return {"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+def wait_for(condition, timeout):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        time.sleep(0.001)
+
+
+def bench_serialization(ticks, codec_name):
+    """onmessage serialization: encode on the publisher side, decode on the subscriber side."""
+    codec = get_codec(codec_name)
+    start = time.perf_counter_ns()
+    frames = [codec.encode(tick) for tick in ticks]
+    encoded_ns = time.perf_counter_ns() - start
+    start = time.perf_counter_ns()
+    for frame in frames:
+        decode_message(frame)
+    decoded_ns = time.perf_counter_ns() - start
+    return {
+        "msgs_per_s": len(ticks) / ((encoded_ns + decoded_ns) / 1e9),
+        "encode_us": encoded_ns / len(ticks) / 1e3,
+        "decode_us": decoded_ns / len(ticks) / 1e3,
+        "bytes_per_msg": sum(len(frame) for frame in frames) / len(frames),
+    }
+
+
+def bench_bus(generator, count, rate, burst, codec_name, address):
+    """MarketPublisher -> ZMQ -> ZmqBatchReceiver, measuring publish-to-receive latency."""
+    latencies = []
+
+    def on_message(message):
+        latencies.append(time.perf_counter_ns() - message["trace"]["publish"])
+
+    publisher = MarketPublisher(address, codec=codec_name)
+    receiver = ZmqBatchReceiver(address, on_message=on_message, high_water_mark=0)
+    receiver.start()
+    time.sleep(0.3)  # ZMQ slow joiner
+
+    start = time.perf_counter()
+    for tick in generator.stream(count, rate, burst):
+        publisher.publish(tick)
+    wait_for(lambda: receiver.received >= count, timeout=5)
+    elapsed = time.perf_counter() - start
+
+    receiver.stop()
+    publisher.close()
+    return {"msgs_per_s": receiver.received / elapsed, "delivered": receiver.received, **percentiles_ms(latencies)}
+
+
+def live_tab(symbols, address):
+    """The Live Market tab main.py ships, watching `symbols` with the first one charted, as update_symbol() sets it."""
+    RealTimeMarket.user_symbol = symbols[0]
+    tab = LiveDataTab(address=address)
+    tab.watchlist = list(symbols)
+    tab.receiver.set_topics(symbols)
+    return tab
+
+
+def bench_gui(generator, ticks, frame_every):
+    """LiveDataTab.receive_data + update_table (table, trend chart, stats) against a headless DearPyGui context."""
+    processor = StreamProcessor()
+    processed = [processor.process(tick) for tick in ticks]
+
+    tab = live_tab(generator.symbols, "tcp://127.0.0.1:1")  # Never activated; ticks are fed directly
+    with dpg.window() as window:
+        with dpg.tab_bar():
+            tab.LiveDataTabUI()
+
+    frame_times = []
+    start = time.perf_counter()
+    for i, message in enumerate(processed, start=1):
+        tab.receive_data(message)
+        if i % frame_every == 0 or i == len(processed):
+            frame_start = time.perf_counter_ns()
+            tab.update_table()
+            frame_times.append(time.perf_counter_ns() - frame_start)
+    elapsed = time.perf_counter() - start
+
+    tab.deactivate()
+    dpg.delete_item(window)
+    return {"msgs_per_s": len(processed) / elapsed, "frames": len(frame_times),
+            **{f"update_table_{key}": value for key, value in percentiles_ms(frame_times).items()}}
+
+
+def bench_pipeline(generator, count, rate, burst, codec_name, in_address, out_address, frame_interval):
+    """Publisher -> StreamStage -> LiveDataTab with a simulated render loop, using the latency tracer."""
+    tracer.reset()
+    stage = StreamStage(in_address, out_address, codec=codec_name)
+    stage.start()
+    tab = live_tab(generator.symbols, out_address)
+    with dpg.window() as window:
+        with dpg.tab_bar():
+            tab.LiveDataTabUI()
+    # Only the receiver is started: activate() would also connect to Fyers and start the tab's own processor
+    tab.receiver.start()
+    publisher = MarketPublisher(in_address, codec=codec_name)
+    time.sleep(0.5)  # ZMQ slow joiner on both hops
+
+    start = time.perf_counter()
+    next_frame = start
+    for tick in generator.stream(count, rate, burst):
+        stamp(tick, "fyers_recv")
+        publisher.publish(tick)
+        if time.perf_counter() >= next_frame:
+            tab.update_table()
+            tracer.frame_rendered()
+            next_frame += frame_interval
+
+    deadline = time.perf_counter() + 5
+    while tab.receiver.received < count and time.perf_counter() < deadline:
+        tab.update_table()
+        tracer.frame_rendered()
+        time.sleep(frame_interval)
+    tab.update_table()
+    tracer.frame_rendered()
+    elapsed = time.perf_counter() - start
+
+    publisher.close()
+    tab.receiver.stop()
+    stage.stop()
+    dpg.delete_item(window)
+    return {
+        "msgs_per_s": tab.receiver.received / elapsed,
+        "delivered": tab.receiver.received,
+        "stage_latency_ms": {label: {"samples": count, "p50": p50, "p95": p95, "p99": p99}
+                             for label, count, p50, p95, p99 in tracer.summary()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live-data path benchmark. Run as: python -m Benchmarks.LivePathBenchmark")
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--rate", type=float, default=0, help="Ticks per second, 0 for max rate")
+    parser.add_argument("--burst", type=int, default=1, help="Ticks released together at each interval")
+    parser.add_argument("--codec", default="json", choices=["json", "struct", "msgpack"])
+    parser.add_argument("--frame-every", type=int, default=100, help="Ticks between update_table calls (GUI stage)")
+    parser.add_argument("--fps", type=float, default=60, help="Simulated render rate (pipeline stage)")
+    parser.add_argument("--base-port", type=int, default=5655)
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    tracer.set_enabled(True)  # The bus and pipeline stages read their latencies from the traces
+    generator = SyntheticTicks(args.symbols)
+    ticks = [generator.tick() for _ in range(args.ticks)]
+    dpg.create_context()
+
+    results = {"config": vars(args), "rss_mb_start": rss_mb()}
+    results["serialization"] = bench_serialization(ticks, args.codec)
+    results["rss_mb_after_serialization"] = rss_mb()
+    results["bus"] = bench_bus(generator, args.ticks, args.rate, args.burst, args.codec,
+                               f"tcp://127.0.0.1:{args.base_port}")
+    results["rss_mb_after_bus"] = rss_mb()
+    results["gui"] = bench_gui(generator, ticks, args.frame_every)
+    results["rss_mb_after_gui"] = rss_mb()
+    results["pipeline"] = bench_pipeline(generator, args.ticks, args.rate, args.burst, args.codec,
+                                         f"tcp://127.0.0.1:{args.base_port + 1}",
+                                         f"tcp://127.0.0.1:{args.base_port + 2}", 1 / args.fps)
+    results["rss_mb_end"] = rss_mb()
+    dpg.destroy_context()
+
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import random
+import time
+
+
+class SyntheticTicks:
+    """Generates Fyers-style SymbolUpdate ticks for a set of symbols with a random-walk price."""
+
+    def __init__(self, num_symbols=50, seed=7):
+        self.random = random.Random(seed)
+        self.symbols = [f"NSE:SYM{i:04d}-EQ" for i in range(num_symbols)]
+        self.prices = {symbol: 100.0 + self.random.random() * 900 for symbol in self.symbols}
+        self.volumes = dict.fromkeys(self.symbols, 0)
+
+    def tick(self):
+        """Return one tick for a random symbol."""
+        symbol = self.random.choice(self.symbols)
+        price = self.prices[symbol] = max(1.0, self.prices[symbol] + self.random.gauss(0, 0.05))
+        traded = self.random.randint(1, 500)
+        self.volumes[symbol] += traded
+        spread = 0.05 * self.random.randint(1, 4)
+        return {
+            "symbol": symbol,
+            "ltp": round(price, 2),
+            "vol_traded_today": self.volumes[symbol],
+            "last_traded_time": int(time.time()),
+            "exch_feed_time": int(time.time()),
+            "bid_size": self.random.randint(1, 5000),
+            "ask_size": self.random.randint(1, 5000),
+            "bid_price": round(price - spread / 2, 2),
+            "ask_price": round(price + spread / 2, 2),
+            "last_traded_qty": traded,
+            "tot_buy_qty": self.random.randint(10000, 1000000),
+            "tot_sell_qty": self.random.randint(10000, 1000000),
+            "avg_trade_price": round(price, 2),
+            "low_price": round(price * 0.98, 2),
+            "high_price": round(price * 1.02, 2),
+            "open_price": round(price * 0.99, 2),
+            "prev_close_price": round(price * 0.995, 2),
+            "type": "sf",
+        }
+
+    def stream(self, count, rate=0, burst=1):
+        """Yield `count` ticks. `rate` is ticks/s (0 for max rate); ticks are released `burst` at a time."""
+        interval = burst / rate if rate > 0 else 0.0
+        next_release = time.perf_counter()
+        for i in range(count):
+            if interval and i % burst == 0:
+                delay = next_release - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                next_release += interval
+            yield self.tick()
@@ -4,6 +4,7 @@ import time
 import datetime
 from threading import Thread
 import math
+from Utils.Indicators import sma, rsi, macd
 
 # Initialize DearPyGUI
 dpg.create_context()
@@ -27,6 +28,8 @@ tickers = ["AAPL", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "NVDA", "JPM", "V",
 
 stock_data = {}
 historical_data = {}
+HISTORY_LENGTH = 250  # Enough closes for the 200-period moving average
+MA_PERIODS = [20, 50, 100, 200]
 
 # Generate dummy news headlines
 news_headlines = [
@@ -96,10 +99,10 @@ for ticker in tickers:
         "dividend_yield": round(random.uniform(0, 4), 2),
     }
 
-    # Generate historical data for charts (last 30 data points)
+    # Generate historical data for charts and indicators (last HISTORY_LENGTH data points)
     historical_data[ticker] = []
     base_price = price * 0.85
-    for i in range(30):
+    for i in range(HISTORY_LENGTH):
         day_price = base_price * (1 + random.uniform(-0.15, 0.25))
         historical_data[ticker].append(round(day_price, 2))
 
@@ -124,7 +127,7 @@ def update_stock_prices():
 
             # Update historical data
             historical_data[ticker].append(new_price)
-            if len(historical_data[ticker]) > 30:
+            if len(historical_data[ticker]) > HISTORY_LENGTH:
                 historical_data[ticker].pop(0)
 
         # Also update indices
@@ -208,6 +211,37 @@ with dpg.theme() as chart_theme:
         dpg.add_theme_color(dpg.mvPlotCol_PlotBg, BLOOMBERG_BLACK, category=dpg.mvThemeCat_Plots)
         dpg.add_theme_color(dpg.mvPlotCol_PlotBorder, BLOOMBERG_DARK, category=dpg.mvThemeCat_Plots)
 
+# Function to compute moving averages and oscillators from the AAPL price history
+def update_technical_indicators():
+    closes = historical_data["AAPL"][-HISTORY_LENGTH:]
+    price = closes[-1]
+    for period in MA_PERIODS:
+        value = sma(closes, period)[-1]
+        dpg.set_value(f"ma_value_{period}", f"{value:.2f}")
+        # Price above its average reads as a buy, below as a sell
+        if price > value:
+            dpg.set_value(f"signal_ma_{period}", "Buy")
+            dpg.bind_item_theme(f"signal_ma_{period}", positive_theme)
+        elif price < value:
+            dpg.set_value(f"signal_ma_{period}", "Sell")
+            dpg.bind_item_theme(f"signal_ma_{period}", negative_theme)
+        else:
+            dpg.set_value(f"signal_ma_{period}", "Neutral")
+            dpg.bind_item_theme(f"signal_ma_{period}", neutral_theme)
+
+    rsi_value = rsi(closes, 14)[-1]
+    dpg.set_value("osc_value_0", f"{rsi_value:.2f}")
+    rsi_signal, rsi_theme = ("Sell", negative_theme) if rsi_value > 70 else \
+        ("Buy", positive_theme) if rsi_value < 30 else ("Neutral", neutral_theme)
+    dpg.set_value("signal_osc_0", rsi_signal)
+    dpg.bind_item_theme("signal_osc_0", rsi_theme)
+
+    line, signal_line, histogram = macd(closes)
+    dpg.set_value("osc_value_1", f"{line[-1]:.2f}")
+    dpg.set_value("signal_osc_1", "Buy" if histogram[-1] > 0 else "Sell")
+    dpg.bind_item_theme("signal_osc_1", positive_theme if histogram[-1] > 0 else negative_theme)
+
+
 # Main window layout
 with dpg.window(label="Fincept Professional", tag="primary_window", no_collapse=True):
     # Top bar with search and Bloomberg branding
@@ -456,22 +490,11 @@ with dpg.window(label="Fincept Professional", tag="primary_window", no_collapse=
                                 dpg.add_table_column(label="Value")
                                 dpg.add_table_column(label="Signal")
 
-                                ma_periods = [20, 50, 100, 200]
-                                signals = ["Buy", "Buy", "Neutral", "Sell"]
-                                colors = [BLOOMBERG_GREEN, BLOOMBERG_GREEN, BLOOMBERG_WHITE, BLOOMBERG_RED]
-
-                                for i, period in enumerate(ma_periods):
+                                for period in MA_PERIODS:
                                     with dpg.table_row():
                                         dpg.add_text(f"MA {period}")
-                                        dpg.add_text(
-                                            f"{stock_data['AAPL']['price'] * (0.9 + i * 0.05):.2f}")
-                                        signal_tag = f"signal_ma_{period}"
-                                        dpg.add_text(signals[i], tag=signal_tag)
-                                        with dpg.theme() as signal_theme:
-                                            with dpg.theme_component(dpg.mvAll):
-                                                dpg.add_theme_color(dpg.mvThemeCol_Text, colors[i],
-                                                                    category=dpg.mvThemeCat_Core)
-                                        dpg.bind_item_theme(signal_tag, signal_theme)
+                                        dpg.add_text("", tag=f"ma_value_{period}")
+                                        dpg.add_text("", tag=f"signal_ma_{period}")
                         with dpg.group():
                             dpg.add_text("Oscillators", color=BLOOMBERG_YELLOW)
                             with dpg.table(header_row=True, borders_innerH=True, borders_outerH=True):
@@ -479,22 +502,20 @@ with dpg.window(label="Fincept Professional", tag="primary_window", no_collapse=
                                 dpg.add_table_column(label="Value")
                                 dpg.add_table_column(label="Signal")
 
+                                # Stochastic and CCI are not computed yet and keep their placeholder values
                                 indicators = ["RSI(14)", "MACD", "Stochastic", "CCI"]
-                                values = ["65.42", "2.15", "75.30", "124.5"]
-                                signals = ["Neutral", "Buy", "Sell", "Buy"]
-                                colors = [BLOOMBERG_WHITE, BLOOMBERG_GREEN, BLOOMBERG_RED, BLOOMBERG_GREEN]
+                                values = ["", "", "75.30", "124.5"]
+                                signals = ["", "", "Sell", "Buy"]
+                                themes = [neutral_theme, neutral_theme, negative_theme, positive_theme]
 
                                 for i, indicator in enumerate(indicators):
                                     with dpg.table_row():
                                         dpg.add_text(indicator)
-                                        dpg.add_text(values[i])
+                                        dpg.add_text(values[i], tag=f"osc_value_{i}")
                                         signal_tag = f"signal_osc_{i}"
                                         dpg.add_text(signals[i], tag=signal_tag)
-                                        with dpg.theme() as signal_theme:
-                                            with dpg.theme_component(dpg.mvAll):
-                                                dpg.add_theme_color(dpg.mvThemeCol_Text, colors[i],
-                                                                    category=dpg.mvThemeCat_Core)
-                                        dpg.bind_item_theme(signal_tag, signal_theme)
+                                        dpg.bind_item_theme(signal_tag, themes[i])
+                    update_technical_indicators()
                 # News Tab
                 with dpg.tab(label="News"):
                     dpg.add_text("FINANCIAL NEWS", color=BLOOMBERG_ORANGE)
@@ -731,6 +752,7 @@ def update_ui():
         dpg.set_value("detail_line", historical_data["AAPL"])
     if dpg.does_item_exist("main_line"):
         dpg.set_value("main_line", historical_data["AAPL"])
+    update_technical_indicators()
 
 # UI update loop running in a separate thread to periodically refresh display
 def ui_update_loop():
@@ -1,5 +1,6 @@
 import dearpygui.dearpygui as dpg
 from FyersAuthentication.fyersauth import get_token, get_profile  # Import methods from fyersauth.py
+from FyersAuthentication.TokenManager import tokens
 
 def authenticate_and_fetch():
     """Fetch Fyers authentication details, generate access token, and display profile dynamically."""
@@ -35,6 +36,12 @@ def authenticate_and_fetch():
             dpg.set_value("auth_status", "Failed to fetch user profile!")
             return
 
+        # The token manager is the single source of the token for the history tab and the live feed
+        tokens.client_id = client_id
+        tokens.set(token)
+        # Let the token manager renew the token with these credentials before it expires
+        tokens.refresher = lambda: get_token(totp_key, username, pin, client_id, secret_key, redirect_uri)
+
         # Display the user profile in the table
         display_user_data(user_data)
         dpg.set_value("auth_status", "Authentication Successful!")
@@ -0,0 +1,83 @@
+import threading
+from contextlib import contextmanager
+import requests
+from requests.adapters import HTTPAdapter
+from fyers_apiv3 import fyersModel
+
+# Keep-alive pool shared by every REST client; sized for HistoryDownloader's concurrent windows
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+
+class FyersClientRegistry:
+    """Hands out one FyersModel per client id, rebuilt only when the access token changes.
+
+    Every client shares a single requests.Session with a connection pool, so bursts of API calls reuse
+    warm TLS connections instead of creating a model, its loggers and a fresh session per request.
+    A FyersModel is not safe to call from several threads (failures write into one shared error dict),
+    so concurrent callers lease() their own model from a per-token pool instead.
+    """
+
+    def __init__(self, log_path=""):
+        self.log_path = log_path
+        self.lock = threading.Lock()
+        self.clients = {}  # client_id -> FyersModel
+        self.idle = {}  # client_id -> (token, [FyersModel not currently leased])
+        self.session = None
+
+    def http_session(self):
+        if self.session is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        return self.session
+
+    def get(self, client_id, token):
+        """The shared FyersModel for `client_id`, created on first use or when `token` differs."""
+        with self.lock:
+            client = self.clients.get(client_id)
+            if client is None or client.token != token:
+                client = self.create(client_id, token)
+                self.clients[client_id] = client
+            return client
+
+    def create(self, client_id, token):
+        client = fyersModel.FyersModel(client_id=client_id, is_async=False, token=token, log_path=self.log_path)
+        client.service.session = self.http_session()  # Replace the per-model session with the pooled one
+        return client
+
+    @contextmanager
+    def lease(self, client_id, token):
+        """A FyersModel for `client_id` used by this thread alone until the block exits, then kept for reuse."""
+        with self.lock:
+            pool_token, pool = self.idle.get(client_id, (token, []))
+            if pool_token != token:
+                pool = []  # Models for an old token are dropped
+            self.idle[client_id] = (token, pool)
+            client = pool.pop() if pool else None
+            if client is None:
+                client = self.create(client_id, token)
+        try:
+            yield client
+        finally:
+            with self.lock:
+                pool_token, pool = self.idle.get(client_id, (None, None))
+                if pool_token == token:
+                    pool.append(client)
+
+    def close(self):
+        with self.lock:
+            self.clients.clear()
+            self.idle.clear()
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+
+
+clients = FyersClientRegistry()
+
+
+def get_client(client_id, token):
+    """Shortcut for the process-wide registry."""
+    return clients.get(client_id, token)
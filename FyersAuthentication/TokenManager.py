@@ -0,0 +1,109 @@
+import base64
+import json
+import os
+import threading
+import time
+
+# access_token.log lives in the repository root, wherever the app is started from
+TOKEN_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "access_token.log")
+TOKEN_PREFIX = "Access Token:"
+CHECK_INTERVAL = 1.0  # Seconds between mtime checks of the token file
+REFRESH_MARGIN = 15 * 60  # Refresh this many seconds before the token expires
+
+
+def token_expiry(token):
+    """Expiry (epoch seconds) from the token's JWT `exp` claim, or None if it cannot be read."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+class TokenManager:
+    """Single source of the Fyers access token: cached in memory, reloaded when the file changes, refreshed early.
+
+    get() costs a dict lookup on the hot path. The file is only stat'ed once per CHECK_INTERVAL and only
+    re-read when its mtime moves, e.g. after another process runs fyersauth. When a `refresher` is set and
+    the token is within REFRESH_MARGIN of expiry, a new token is fetched on a background thread.
+    """
+
+    def __init__(self, path=TOKEN_FILE, refresher=None, refresh_margin=REFRESH_MARGIN, check_interval=CHECK_INTERVAL):
+        self.path = path
+        self.refresher = refresher  # Callable returning a fresh token, e.g. a bound fyersauth.get_token
+        self.client_id = None  # App id the token was issued for, once a login in this process has set it
+        self.refresh_margin = refresh_margin
+        self.check_interval = check_interval
+        self.lock = threading.Lock()
+        self.token = None
+        self.expires_at = None
+        self.mtime = None
+        self.checked_at = 0.0
+        self.refreshing = False
+
+    def get(self):
+        """The current token, or None when there is none or it has expired and cannot be refreshed."""
+        now = time.time()
+        if now - self.checked_at >= self.check_interval:
+            self.reload_if_changed()
+            self.checked_at = now
+
+        if self.expires_at is not None and self.refresher is not None:
+            if now >= self.expires_at:
+                self.refresh()  # Already lapsed: nothing usable to return, so wait for the new token
+            elif now >= self.expires_at - self.refresh_margin:
+                self.refresh_in_background()
+
+        if self.expires_at is not None and time.time() >= self.expires_at:
+            return None  # Known to be expired; don't let a request fail authentication
+        return self.token
+
+    def set(self, token):
+        """Store a new token in memory and in the token file."""
+        with self.lock:
+            with open(self.path, "w") as f:
+                f.write(f"{TOKEN_PREFIX} {token}")
+            self.token = token
+            self.expires_at = token_expiry(token)
+            self.mtime = os.stat(self.path).st_mtime_ns
+
+    def reload_if_changed(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self.mtime:
+            return
+
+        token = None
+        if mtime is not None:
+            with open(self.path, "r") as f:
+                token_line = f.readline().strip()
+            if token_line.startswith(TOKEN_PREFIX):
+                token = token_line.split(TOKEN_PREFIX)[1].strip()
+        with self.lock:
+            self.token = token or None
+            self.expires_at = token_expiry(token) if token else None
+            self.mtime = mtime
+
+    def refresh(self):
+        """Fetch a new token with the refresher. Failures keep the current token and are printed."""
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+        try:
+            self.set(self.refresher())
+            print("🔑 Fyers access token refreshed")
+        except Exception as e:
+            print(f"❌ Fyers token refresh failed: {e}")
+        finally:
+            self.refreshing = False
+
+    def refresh_in_background(self):
+        if not self.refreshing:
+            threading.Thread(target=self.refresh, daemon=True).start()
+
+
+tokens = TokenManager()
@@ -1,11 +1,12 @@
 import base64
 import hmac
-import os
 import struct
 import time
 from urllib.parse import urlparse, parse_qs
 import requests
 from fyers_apiv3 import fyersModel
+from FyersAuthentication.FyersClient import get_client
+from FyersAuthentication.TokenManager import tokens
 
 
 totp_key = "USE_YOUR_TOTP_KEY"
@@ -17,19 +18,10 @@ redirect_uri = "https://google.com"
 
 
 def read_file():
-    try:
-        with open("access_token.log", "r") as f:
-            token_line = f.readline().strip()
-            if token_line.startswith("Access Token:"):
-                token = token_line.split("Access Token:")[1].strip()
-                return token
-        return None
-    except FileNotFoundError:
-        return None
+    return tokens.get()
 
 def write_file(token):
-    with open("access_token.log", "w") as f:
-        f.write(f"Access Token: {token}")
+    tokens.set(token)
 
 def totp(key, time_step=30, digits=6, digest="sha1"):
     key = base64.b32decode(key.upper() + "=" * ((8 - len(key)) % 8))
@@ -76,7 +68,7 @@ def get_token(totp_key, username, pin, client_id, secret_key, redirect_uri):
     return response["access_token"]
 
 def get_profile(token, client_id):
-    fyers = fyersModel.FyersModel(client_id=client_id, token=token, log_path=os.getcwd())
+    fyers = get_client(client_id, token)
     return fyers.get_profile()
 
 def main():
@@ -0,0 +1,134 @@
+import queue
+import threading
+import time
+from FyersData.CandleCache import candle_cache, resolution_seconds
+from Utils.Indicators import SESSION_UTC_OFFSET
+
+# Bar sizes built from live ticks, using Fyers history resolution names
+LIVE_RESOLUTIONS = ("1", "5", "15", "60", "D")
+# Session open in exchange time (09:15 IST); Fyers intraday candles are counted from it, not from the epoch
+SESSION_OPEN_SECONDS = 9 * 3600 + 15 * 60
+
+
+def bar_start(timestamp, resolution):
+    """Start of the bar containing `timestamp`, on the same grid as Fyers history.
+
+    Daily bars start at midnight exchange time; intraday bars are counted from the 09:15 session open, so
+    hourly bars start at 09:15, 10:15, ... rather than on epoch multiples (09:30 IST).
+    """
+    seconds = resolution_seconds(resolution)
+    local = timestamp + SESSION_UTC_OFFSET
+    if seconds >= 86400:
+        return local // seconds * seconds - SESSION_UTC_OFFSET
+    session_open = local // 86400 * 86400 + SESSION_OPEN_SECONDS
+    return session_open + (local - session_open) // seconds * seconds - SESSION_UTC_OFFSET
+
+
+def on_grid(timestamp, resolution, reference=None):
+    """Whether `timestamp` is a bar start for `resolution`, and a whole number of bars from `reference` if given."""
+    if bar_start(timestamp, resolution) != timestamp:
+        return False
+    return reference is None or (timestamp - reference) % resolution_seconds(resolution) == 0
+
+
+class CandleAggregator:
+    """Builds OHLCV bars per symbol and resolution from SymbolUpdate ticks.
+
+    update() runs on the WebSocket thread. When the first tick of the next bar arrives the closed bar is queued
+    for a writer thread that appends it to the symbol's CandleStore, so the socket thread never does file I/O
+    or waits on a store lock. The bar still forming is kept in memory and read by the UI through current().
+    The first bar of each series started before the app was listening, so it is marked partial and never
+    persisted. Bar volume comes from the change in the cumulative vol_traded_today.
+    """
+
+    def __init__(self, resolutions=LIVE_RESOLUTIONS, cache=candle_cache):
+        self.resolutions = resolutions
+        self.cache = cache
+        self.lock = threading.Lock()
+        self.bars = {}  # (symbol, resolution) -> forming bar dict
+        self.last_volume = {}  # symbol -> vol_traded_today of the previous tick
+        self.pending = queue.Queue()  # (symbol, resolution, bar) waiting to be written
+        self.writer = None
+
+    def update(self, tick):
+        price = tick.get("ltp")
+        symbol = tick.get("symbol")
+        if price is None or symbol is None:
+            return
+        timestamp = int(tick.get("last_traded_time") or tick.get("exch_feed_time") or time.time())
+        cumulative = tick.get("vol_traded_today")
+
+        closed = []
+        with self.lock:
+            previous = self.last_volume.get(symbol)
+            traded = max(cumulative - previous, 0) if cumulative is not None and previous is not None else 0
+            if cumulative is not None:
+                self.last_volume[symbol] = cumulative
+
+            for resolution in self.resolutions:
+                start = bar_start(timestamp, resolution)
+                bar = self.bars.get((symbol, resolution))
+                if bar is not None and start < bar["timestamp"]:
+                    continue  # Late tick for a bar that has already been written
+                if bar is None or start > bar["timestamp"]:
+                    if bar is not None and not bar["partial"]:
+                        closed.append((resolution, bar))
+                    bar = {"timestamp": start, "open": price, "high": price, "low": price, "close": price,
+                           "volume": 0, "revision": 0, "partial": bar is None}
+                    self.bars[(symbol, resolution)] = bar
+                else:
+                    bar["high"] = max(bar["high"], price)
+                    bar["low"] = min(bar["low"], price)
+                    bar["close"] = price
+                bar["volume"] += traded
+                bar["revision"] += 1
+
+        for resolution, bar in closed:
+            self.queue_write(symbol, resolution, bar)
+
+    def queue_write(self, symbol, resolution, bar):
+        if self.writer is None:
+            with self.lock:
+                if self.writer is None:
+                    self.writer = threading.Thread(target=self.run_writer, name="candle-writer", daemon=True)
+                    self.writer.start()
+        self.pending.put((symbol, resolution, bar))
+
+    def run_writer(self):
+        while True:
+            symbol, resolution, bar = self.pending.get()
+            try:
+                self.write(symbol, resolution, bar)
+            except Exception as e:
+                print(f"❌ Could not write {symbol} {resolution} bar: {e}")
+            finally:
+                self.pending.task_done()
+
+    def write(self, symbol, resolution, bar):
+        store = self.cache.store(symbol, resolution)
+        with store.lock:
+            stored = store.columns()["timestamp"]
+            reference = int(stored[-1]) if len(stored) else None
+        if not on_grid(bar["timestamp"], resolution, reference):
+            # Mixing two bar grids in one store would corrupt the history it serves
+            print(f"⚠️ Not storing {symbol} {resolution} bar at {bar['timestamp']}: off the history grid")
+            return
+        store.write({name: [bar[name]] for name in ("timestamp", "open", "high", "low", "close", "volume")})
+
+    def current(self, symbol, resolution):
+        """Copy of the bar still forming for (symbol, resolution), or None before the first tick."""
+        with self.lock:
+            bar = self.bars.get((symbol, str(resolution)))
+            return dict(bar) if bar is not None else None
+
+    def flush(self):
+        """Write every forming bar to its store and wait for queued writes, e.g. before shutting down."""
+        with self.lock:
+            bars = [(key, dict(bar)) for key, bar in self.bars.items()]
+        for (symbol, resolution), bar in bars:
+            if not bar["partial"]:
+                self.queue_write(symbol, resolution, bar)
+        self.pending.join()
+
+
+aggregator = CandleAggregator()
@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+from FyersData.CandleStore import CandleStore, candles_to_columns
+
+# candle_cache/ lives in the repository root, wherever the app is started from
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "candle_cache")
+
+
+def resolution_seconds(resolution):
+    """Bar length in seconds for a Fyers resolution string ("5S", "1", "60", "D", ...)."""
+    resolution = str(resolution).upper()
+    if resolution in ("D", "1D", "DAY"):
+        return 86400
+    if resolution.endswith("S"):
+        return int(resolution[:-1])
+    return int(resolution) * 60
+
+
+def add_interval(coverage, start, end):
+    """Union [start, end] into a sorted list of disjoint (start, end) intervals; touching intervals merge."""
+    merged = []
+    for lo, hi in sorted(coverage + [(start, end)]):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def missing_ranges(coverage, start, end):
+    """Sub-ranges of [start, end] not covered by any interval in `coverage`."""
+    gaps = []
+    cursor = start
+    for lo, hi in coverage:
+        if hi < cursor:
+            continue
+        if lo > end:
+            break
+        if lo > cursor:
+            gaps.append((cursor, lo - 1))
+        cursor = max(cursor, hi + 1)
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class CandleCache:
+    """On-disk candle cache per (symbol, resolution) that only downloads ranges it has not fetched before.
+
+    Each series is a memory-mapped CandleStore that also remembers the epoch intervals already fetched,
+    so a range with no trading days is not requested again.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.stores = {}  # (symbol, resolution) -> CandleStore
+        self.stores_lock = threading.Lock()
+
+    def store(self, symbol, resolution):
+        """The CandleStore for a series, opened once and shared by every caller."""
+        with self.stores_lock:
+            key = (symbol, str(resolution))
+            if key not in self.stores:
+                name = f"{symbol}_{resolution}".replace(":", "_").replace("/", "_")
+                self.stores[key] = CandleStore(os.path.join(self.cache_dir, name))
+            return self.stores[key]
+
+    def get(self, symbol, resolution, range_from, range_to, fetch):
+        """History-style response for [range_from, range_to], calling `fetch(gap_from, gap_to)` only for gaps.
+
+        `fetch` returns a Fyers history response. On the first failed gap its response is returned unchanged.
+        The candles come back under "columns" as read-only views of the store's memory maps.
+        """
+        start, end = int(range_from), int(range_to)
+        store = self.store(symbol, resolution)
+        with store.lock:
+            gaps = missing_ranges(store.coverage, start, end)
+
+        # The store lock is only held while writing, never across a download, so live bar writes don't wait on it
+        for gap_from, gap_to in gaps:
+            response = fetch(gap_from, gap_to)
+            if response.get("s") not in ("ok", "no_data"):
+                return response
+            # HistoryDownloader already returns columns; a plain history response still has row lists
+            columns = response.get("columns") or candles_to_columns(response.get("candles", []))
+            # The bar still forming is not final, so it stays uncovered and is fetched again next time
+            settled = min(gap_to, int(time.time()) - resolution_seconds(resolution))
+            with store.lock:
+                store.write(columns)
+                if settled >= gap_from:
+                    store.set_coverage(add_interval(store.coverage, gap_from, settled))
+
+        return {"s": "ok", "columns": store.slice(start, end)}
+
+
+# Shared by the history tab and the live bar aggregator so both write through the same CandleStore objects
+candle_cache = CandleCache()
@@ -0,0 +1,148 @@
+import json
+import os
+import threading
+import numpy as np
+
+# Column name -> on-disk dtype. Each column is a flat little-endian binary file that is memory-mapped on open.
+CANDLE_COLUMNS = (
+    ("timestamp", np.dtype("<i8")),
+    ("open", np.dtype("<f8")),
+    ("high", np.dtype("<f8")),
+    ("low", np.dtype("<f8")),
+    ("close", np.dtype("<f8")),
+    ("volume", np.dtype("<i8")),
+)
+
+
+def candles_to_columns(candles):
+    """Fyers history rows ([timestamp, open, high, low, close, volume], ...) as typed column arrays in one pass."""
+    rows = np.asarray(candles, dtype=np.float64).reshape(-1, len(CANDLE_COLUMNS))
+    return {name: rows[:, i].astype(dtype) for i, (name, dtype) in enumerate(CANDLE_COLUMNS)}
+
+
+def merge_columns(chunks):
+    """Concatenate column dicts into one ordered by timestamp; the first chunk wins on duplicate timestamps."""
+    if not chunks:
+        return candles_to_columns([])
+    combined = {name: np.concatenate([chunk[name] for chunk in chunks]) for name, _ in CANDLE_COLUMNS}
+    _, first = np.unique(combined["timestamp"], return_index=True)
+    return {name: column[first] for name, column in combined.items()}
+
+
+class CandleStore:
+    """Memory-mapped columnar candle series for one (symbol, resolution), sorted by timestamp.
+
+    meta.json records the row count, the current file generation and the fetched coverage intervals.
+    Bars after the last one are appended to the column files and the last bar can be rewritten in place;
+    anything that lands earlier rewrites the columns into a new generation, so existing read-only maps
+    handed out to the UI stay valid.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.rows = 0
+        self.generation = 0
+        self.coverage = []  # Sorted disjoint (start, end) epoch intervals already fetched
+        self.maps = None
+        self.load_meta()
+
+    def meta_path(self):
+        return os.path.join(self.path, "meta.json")
+
+    def column_path(self, name, generation=None):
+        return os.path.join(self.path, f"{name}.{self.generation if generation is None else generation}.bin")
+
+    def load_meta(self):
+        try:
+            with open(self.meta_path(), "r") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self.rows = meta["rows"]
+        self.generation = meta["generation"]
+        self.coverage = [tuple(interval) for interval in meta["coverage"]]
+
+    def save_meta(self):
+        os.makedirs(self.path, exist_ok=True)
+        temp = self.meta_path() + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"rows": self.rows, "generation": self.generation, "coverage": self.coverage}, f)
+        os.replace(temp, self.meta_path())  # meta.json is the commit point for every write
+
+    def set_coverage(self, coverage):
+        with self.lock:
+            self.coverage = list(coverage)
+            self.save_meta()
+
+    def columns(self):
+        """Read-only memory maps of every column, trimmed to the committed row count. No data is copied."""
+        with self.lock:
+            if self.maps is None:
+                self.maps = {}
+                for name, dtype in CANDLE_COLUMNS:
+                    if self.rows:
+                        self.maps[name] = np.memmap(self.column_path(name), dtype=dtype, mode="r", shape=(self.rows,))
+                    else:
+                        self.maps[name] = np.empty(0, dtype=dtype)
+            return self.maps
+
+    def __len__(self):
+        return self.rows
+
+    def slice(self, start, end):
+        """Views of the candles with start <= timestamp <= end, as a column name -> array dict."""
+        columns = self.columns()
+        lo = int(np.searchsorted(columns["timestamp"], start, side="left"))
+        hi = int(np.searchsorted(columns["timestamp"], end, side="right"))
+        return {name: column[lo:hi] for name, column in columns.items()}
+
+    def write(self, columns):
+        """Insert candles given as a column name -> array dict; they replace stored rows with the same timestamp."""
+        timestamps = np.asarray(columns["timestamp"], dtype=np.int64)
+        if len(timestamps) == 0:
+            return
+        # Sort the new rows and keep the last occurrence of any repeated timestamp
+        order = np.argsort(timestamps, kind="stable")
+        _, last = np.unique(timestamps[order][::-1], return_index=True)
+        keep = order[::-1][last]
+        new = {name: np.asarray(columns[name], dtype=dtype)[keep] for name, dtype in CANDLE_COLUMNS}
+
+        with self.lock:
+            existing = self.columns()
+            tail = existing["timestamp"][-1] if self.rows else None
+            if tail is None or new["timestamp"][0] >= tail:
+                self.append(new, replace_last=tail is not None and new["timestamp"][0] == tail)
+            else:
+                self.rewrite(existing, new)
+
+    def append(self, new, replace_last):
+        os.makedirs(self.path, exist_ok=True)
+        for name, dtype in CANDLE_COLUMNS:
+            with open(self.column_path(name), "r+b" if os.path.exists(self.column_path(name)) else "wb") as f:
+                # Bytes past the committed row count are leftovers of an interrupted write and get overwritten
+                f.seek((self.rows - 1 if replace_last else self.rows) * dtype.itemsize)
+                f.write(new[name].tobytes())
+        self.rows += len(new["timestamp"]) - (1 if replace_last else 0)
+        self.save_meta()
+        self.maps = None
+
+    def rewrite(self, existing, new):
+        merged = merge_columns([new, existing])  # New rows come first, so they win
+        self.generation += 1
+        os.makedirs(self.path, exist_ok=True)
+        for name, _ in CANDLE_COLUMNS:
+            merged[name].tofile(self.column_path(name))
+        self.rows = len(merged["timestamp"])
+        self.save_meta()
+        self.maps = None
+        self.remove_stale_generations()
+
+    def remove_stale_generations(self):
+        current = f".{self.generation}.bin"
+        for filename in os.listdir(self.path):
+            if filename.endswith(".bin") and not filename.endswith(current):
+                try:
+                    os.remove(os.path.join(self.path, filename))
+                except OSError:
+                    pass  # Still mapped by an open view on Windows; retried after the next rewrite
@@ -1,11 +1,15 @@
-import json
-import zmq
+import argparse
 from fyers_apiv3.FyersWebsocket import data_ws
+from FyersData.MarketPublisher import MarketPublisher
+from Utils.LatencyTracer import stamp
+from FyersData.TickReplay import TickRecorder
 
-# Initialize ZeroMQ context and PUB socket
-context = zmq.Context()
-socket = context.socket(zmq.PUB)  # PUB socket to allow multiple subscribers
-socket.bind("tcp://127.0.0.1:5555")  # Publishing data on localhost
+# Publish ticks on localhost. JSON is what StreamProcessing.exe parses; use
+# codec="struct" or "msgpack" when the consumer understands the binary formats.
+publisher = MarketPublisher("tcp://127.0.0.1:5555", codec="json")
+
+# Optional TickRecorder capturing raw payloads for offline replay (see --record)
+recorder = None
 
 
 def onmessage(message):
@@ -14,15 +18,15 @@ def onmessage(message):
     Sends the processed message to the C++ stream processing framework.
     """
     try:
+        if recorder is not None:
+            recorder.record(message)
+        stamp(message, "fyers_recv")
         print("📩 Received Market Data:", message)
 
-        # Convert message to JSON format
-        json_data = json.dumps(message)
-
-        # Send JSON formatted data to C++ application
-        socket.send_string(json_data)
+        # Encode with the publisher's wire codec and send to the C++ application
+        publisher.publish(message)
 
-        print("✅ Sent Data to C++:", json_data)
+        print("✅ Sent Data to C++")
 
     except Exception as e:
         print(f"❌ Error processing message: {e}")
@@ -66,5 +70,11 @@ fyers = data_ws.FyersDataSocket(
 
 # Connect to Fyers WebSocket
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream Fyers ticks to the ZMQ bus.")
+    parser.add_argument("--record", help="Append raw ticks to this file for replay with FyersData.TickReplay")
+    args = parser.parse_args()
+    if args.record:
+        recorder = TickRecorder(args.record)
+
     print("🚀 Starting Fyers Live Data Stream...")
     fyers.connect()
@@ -1,50 +1,159 @@
 import dearpygui.dearpygui as dpg
-from fyers_apiv3 import fyersModel
+import numpy as np
+from FyersAuthentication.TokenManager import tokens
 from Utils.ModalNotification import ModalNotification
+from Utils.Decimation import lttb, decimate_ohlc
+from Utils.VirtualTable import VirtualTable
+from Utils.Indicators import sma, ema, bollinger, RollingSMA, RollingEMA, RollingBollinger
+from Utils.BackgroundTasks import BackgroundTasks
+from FyersData.HistoryDownloader import HistoryDownloader
+from FyersData.CandleCache import candle_cache, resolution_seconds
+from FyersData.CandleAggregator import aggregator, on_grid
+from FyersData.LiveFeed import feed, IDLE_TEARDOWN_SECONDS
+import datetime
 import time
 import random
 
+LIVE_REFRESH_SECONDS = 0.25  # Minimum interval between applying the forming live bar to the charts
+
+# Resolutions accepted by the Fyers history API
+HISTORY_RESOLUTIONS = ("1", "2", "3", "5", "10", "15", "20", "30", "60", "120", "240", "D")
+
+
+def parse_time(text, end_of_day=False):
+    """Epoch seconds from an epoch number, "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" (local time).
+
+    A bare date means the start of that day, or its last second when `end_of_day` is set.
+    """
+    text = text.strip()
+    try:
+        return int(float(text))
+    except ValueError:
+        pass
+    value = datetime.datetime.fromisoformat(text)  # Raises ValueError for anything else
+    if end_of_day and len(text) <= 10:
+        value += datetime.timedelta(days=1, seconds=-1)
+    return int(value.timestamp())
+
+
 class FyersDataTab:
     def __init__(self):
         self.client_id = "FYERS_CLIENT_ID"
+        self.symbol = "NSE:SBIN-EQ"
+        self.resolution = "60"
+        self.range_from = "1690895316"
+        self.range_to = "1691068173"
+        self.pending_request = None  # (symbol, resolution, range_from, range_to) of the fetch in flight
+        self.loaded_range_to = None  # range_to of the history on screen; live bars past it are not glued on
         self.modal = ModalNotification()  # Initialize modal notification
 
+        # Full-resolution candles; plots only ever receive a pixel-sized subset of these
+        self.timestamps = np.empty(0)
+        self.open_prices = np.empty(0)
+        self.high_prices = np.empty(0)
+        self.low_prices = np.empty(0)
+        self.close_prices = np.empty(0)
+        self.volumes = np.empty(0)
+        self.overlays = {}  # Candle-plot series tag -> indicator values aligned with self.timestamps
+        self.rolling = {}  # Rolling indicators that extend the overlays as live bars arrive
+        self.plot_limits = {}  # Plot tag -> x-axis limits the current level of detail was computed for
+
+        # Only one page of candle rows ever exists as widgets, however long the history is
+        self.candle_table = VirtualTable("fyers_table", ["Timestamp", "Open", "High", "Low", "Close", "Volume"],
+                                         formatters=[lambda value: str(int(value))] + [str] * 5)
+
+        # History requests run on worker threads; results come back through on_frame()
+        self.tasks = BackgroundTasks()
+        self.fetch_token = None  # CancelToken of the fetch in flight, if any
+        self.candle_cache = candle_cache  # Candles already downloaded are served from disk
+
+        # Bars built from live ticks extend the fetched history without another request
+        self.live_revision = None
+        self.live_base = None  # Fetched candle a partial live bar is merged into
+        self.live_applied_at = 0.0
+        self.feed_symbol = None  # Symbol this tab holds the live feed for, None while it holds no feed
+        self.feed_shown_at = 0.0
+
     def read_access_token(self):
-        """Reads access token from access_token.log file."""
-        try:
-            with open("C:/Users/JAIMIN/Desktop/dearpyguiTerminal/access_token.log", "r") as f:
-                token_line = f.readline().strip()
-                if token_line.startswith("Access Token:"):
-                    return token_line.split("Access Token:")[1].strip()
-            return None  # If format is incorrect
-        except FileNotFoundError:
-            return None  # If file doesn't exist
-
-    def fetch_historic_data(self, symbol="NSE:SBIN-EQ", resolution="60", range_from="1690895316", range_to="1691068173"):
-        """Fetch historic data from Fyers API using the latest access token."""
+        """Current access token from the shared token manager (cached in memory, reloaded when the file changes)."""
+        return tokens.get()
+
+    def fetch_historic_data(self, symbol="NSE:SBIN-EQ", resolution="60", range_from="1690895316", range_to="1691068173",
+                            cancel_token=None, progress=None):
+        """Fetch historic data from Fyers API using the latest access token.
+
+        Only ranges missing from the local candle cache are requested; ranges longer than one request
+        allows are split and downloaded concurrently by HistoryDownloader.
+        """
         self.access_token = self.read_access_token()  # Fetch the latest token when fetching data
         if not self.access_token:
-            self.modal.show("Access token not found. Please generate the Fyers access token from the settings.")
             return None  # Stop execution if no access token is found
 
-        self.fyers = fyersModel.FyersModel(client_id=self.client_id, is_async=False, token=self.access_token, log_path="")
+        # Each concurrent history call leases its own client; they share one connection pool
+        downloader = HistoryDownloader(tokens.client_id or self.client_id, self.access_token)
 
-        data = {
-            "symbol": symbol,
-            "resolution": resolution,
-            "date_format": "0",
-            "range_from": range_from,
-            "range_to": range_to,
-            "cont_flag": "1"
-        }
+        def fetch_gap(gap_from, gap_to):
+            return downloader.download(symbol, resolution, gap_from, gap_to, cancel_token=cancel_token,
+                                       progress=progress)
 
-        response = self.fyers.history(data=data)
+        response = self.candle_cache.get(symbol, resolution, range_from, range_to, fetch_gap)
         return response
 
     def display_fyers_data(self):
-        """Fetch and display Fyers data in a DearPyGui table and update graph."""
-        response = self.fetch_historic_data()
+        """Start fetching Fyers data in the background; the table and graph update when it arrives."""
+        if self.fetch_token is not None:
+            dpg.set_value("fyers_status", "A fetch is already running")
+            return
+
+        try:
+            range_from = parse_time(dpg.get_value("fyers_range_from"))
+            range_to = parse_time(dpg.get_value("fyers_range_to"), end_of_day=True)
+        except ValueError:
+            dpg.set_value("fyers_status", "Enter the range as an epoch or YYYY-MM-DD [HH:MM]")
+            return
+        if range_to < range_from:
+            dpg.set_value("fyers_status", "The range ends before it starts")
+            return
+        symbol = dpg.get_value("fyers_symbol").strip() or self.symbol
+
+        # The tab keeps showing (and extending) the current history until the new one arrives
+        self.pending_request = (symbol, dpg.get_value("fyers_resolution"), str(range_from), str(range_to))
+        dpg.set_value("fyers_status", "Fetching data...")
+        self.fetch_token = self.tasks.submit(self.fetch_job, self.pending_request, on_done=self.show_fyers_data,
+                                             on_error=self.show_fetch_error, on_progress=self.show_fetch_progress,
+                                             on_cancel=self.show_fetch_cancelled)
+
+    def fetch_job(self, cancel_token, progress, request):
+        """Runs on a worker thread. Must not touch DearPyGui."""
+        progress("Requesting history from Fyers...")
+        symbol, resolution, range_from, range_to = request
+        response = self.fetch_historic_data(symbol, resolution, range_from, range_to,
+                                            cancel_token=cancel_token, progress=progress)
+        cancel_token.check()
+        return response
+
+    def cancel_fetch(self):
+        """Cancel the fetch in flight. The HTTP call cannot be interrupted, so its result is discarded."""
+        if self.fetch_token is not None:
+            self.fetch_token.cancel()
+            dpg.set_value("fyers_status", "Cancelling...")
+
+    def show_fetch_progress(self, message):
+        dpg.set_value("fyers_status", message)
+
+    def show_fetch_error(self, error):
+        self.fetch_token = None
+        dpg.set_value("fyers_status", f"Error: {error}")
+
+    def show_fetch_cancelled(self, _):
+        self.fetch_token = None
+        dpg.set_value("fyers_status", "Fetch cancelled")
+
+    def show_fyers_data(self, response):
+        """Display a history response in the table and graph. Runs on the UI thread."""
+        self.fetch_token = None
         if response is None:
+            self.modal.show("Access token not found or expired. Please generate the Fyers access token from the settings.")
             return  # Stop execution if no access token or response
 
         # Validate response
@@ -53,60 +162,243 @@ class FyersDataTab:
             return
 
         dpg.set_value("fyers_status", "Data Fetched Successfully")
+        if self.pending_request is not None:
+            self.symbol, self.resolution, self.range_from, self.range_to = self.pending_request
 
-        # Clear only rows, keeping the table intact
-        rows = dpg.get_item_children("fyers_table", 1)  # Get table rows
-        if rows:
-            for row in rows:
-                dpg.delete_item(row)  # Remove only the rows
-
-        timestamps, open_prices, high_prices, low_prices, close_prices, volumes = [], [], [], [], [], []
-
-        # Populate table with new data
-        for candle in response["candles"]:
-            timestamp, open_price, high, low, close, volume = candle
-            timestamps.append(timestamp)
-            open_prices.append(open_price)
-            high_prices.append(high)
-            low_prices.append(low)
-            close_prices.append(close)
-            volumes.append(volume)
-
-            with dpg.table_row(parent="fyers_table"):
-                dpg.add_text(str(timestamp))
-                dpg.add_text(str(open_price))
-                dpg.add_text(str(high))
-                dpg.add_text(str(low))
-                dpg.add_text(str(close))
-                dpg.add_text(str(volume))
+        # Columns are read-only views of the memory-mapped candle store; nothing is parsed or copied here
+        columns = response["columns"]
+        self.candle_table.set_data([columns["timestamp"], columns["open"], columns["high"], columns["low"],
+                                    columns["close"], columns["volume"]])
 
         # Update Graphs
-        self.update_fyers_graph(timestamps, open_prices, high_prices, low_prices, close_prices)
+        self.volumes = columns["volume"]
+        self.loaded_range_to = int(self.range_to)
+        self.live_revision = None
+        self.live_base = None
+        self.update_fyers_graph(columns["timestamp"], columns["open"], columns["high"], columns["low"],
+                                columns["close"])
 
     def update_fyers_graph(self, timestamps, open_prices, high_prices, low_prices, close_prices):
-        """Update the DearPyGui plot with new data."""
-        dpg.configure_item("open_series", x=timestamps, y=open_prices)
-        dpg.configure_item("high_series", x=timestamps, y=high_prices)
-        dpg.configure_item("low_series", x=timestamps, y=low_prices)
-        dpg.configure_item("close_series", x=timestamps, y=close_prices)
-        dpg.configure_item("ohlc_series", dates=timestamps, opens=open_prices, closes=close_prices, lows=low_prices, highs=high_prices)
+        """Store the full history and show a decimated view fitted to the whole range."""
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.open_prices = np.asarray(open_prices, dtype=np.float64)
+        self.high_prices = np.asarray(high_prices, dtype=np.float64)
+        self.low_prices = np.asarray(low_prices, dtype=np.float64)
+        self.close_prices = np.asarray(close_prices, dtype=np.float64)
+        self.update_overlays()
+
+        full_range = (self.timestamps[0], self.timestamps[-1]) if len(self.timestamps) else (0.0, 0.0)
+        self.update_line_lod(full_range)
+        self.update_candle_lod(full_range)
+        for axis in ("fyers_line_x", "fyers_line_y", "fyers_candle_x", "fyers_candle_y"):
+            dpg.fit_axis_data(axis)
+        self.plot_limits.clear()
+
+    def update_overlays(self):
+        """Indicators are computed once over the whole history; zooming only re-decimates them."""
+        closes = self.close_prices
+        middle, upper, lower = bollinger(closes, 20)
+        ema_50 = ema(closes, 50)
+        self.overlays = {
+            "sma_20_series": sma(closes, 20),
+            "ema_50_series": ema_50,
+            "bb_upper_series": upper,
+            "bb_lower_series": lower,
+        }
+        # Seeded without the last bar and then updated with it, so a live change to that bar can replace() it
+        self.rolling = {"sma": RollingSMA(20), "ema": RollingEMA(50), "bollinger": RollingBollinger(20)}
+        if len(closes):
+            self.rolling["sma"].seed(closes[:-1])
+            self.rolling["ema"].seed(closes[:-1], ema_50[-2] if len(closes) > 1 else np.nan)
+            self.rolling["bollinger"].seed(closes[:-1])
+            for indicator in self.rolling.values():
+                indicator.update(closes[-1])
+
+    def update_overlay_tail(self, appended):
+        """Extend each indicator by the appended bar, or correct its last value after the last bar changed."""
+        closes = self.close_prices
+        for tag, values in self.overlays.items():
+            if len(values) < len(closes):
+                self.overlays[tag] = np.append(values, np.nan)
+        method = "update" if appended else "replace"
+        self.overlays["sma_20_series"][-1] = getattr(self.rolling["sma"], method)(closes[-1])
+        self.overlays["ema_50_series"][-1] = getattr(self.rolling["ema"], method)(closes[-1])
+        _, upper, lower = getattr(self.rolling["bollinger"], method)(closes[-1])
+        self.overlays["bb_upper_series"][-1] = upper
+        self.overlays["bb_lower_series"][-1] = lower
+
+    def continues_history(self, bar_timestamp):
+        """Whether a live bar belongs at the end of the loaded history rather than after a gap.
+
+        It does when it is the last loaded candle, when the loaded range reaches its start, or when it is the
+        bucket right after the last loaded candle. Live bars are never glued onto a range that ended in the past,
+        nor onto history whose candles sit on a different grid.
+        """
+        last = self.timestamps[-1]
+        if bar_timestamp < last or not on_grid(bar_timestamp, self.resolution, int(last)):
+            return False
+        return (bar_timestamp == last or bar_timestamp <= self.loaded_range_to
+                or bar_timestamp == last + resolution_seconds(self.resolution))
+
+    def apply_live_bar(self):
+        """Merge the aggregator's forming bar into the loaded history: update the last bar in place or append one."""
+        bar = aggregator.current(self.symbol, self.resolution)
+        if bar is None or len(self.timestamps) == 0 or not self.continues_history(bar["timestamp"]):
+            return False
+        key = (bar["timestamp"], bar["revision"])
+        if key == self.live_revision:
+            return False
+        self.live_revision = key
+
+        appended = bar["timestamp"] != self.timestamps[-1]
+        if not appended:
+            resized = not self.close_prices.flags.writeable
+            if resized:
+                # Columns loaded from the store are read-only maps; take private copies once
+                self.open_prices, self.high_prices, self.low_prices, self.close_prices = (
+                    np.array(self.open_prices), np.array(self.high_prices), np.array(self.low_prices),
+                    np.array(self.close_prices))
+                self.volumes = np.array(self.volumes)
+            if bar["partial"] and self.live_base is None:
+                # The fetched candle already holds the ticks from before the app started listening
+                self.live_base = (self.open_prices[-1], self.high_prices[-1], self.low_prices[-1], self.volumes[-1])
+            if bar["partial"]:
+                open_price, high, low, volume = self.live_base
+                bar["open"], bar["high"], bar["low"] = open_price, max(high, bar["high"]), min(low, bar["low"])
+                bar["volume"] += volume
+            self.open_prices[-1], self.high_prices[-1] = bar["open"], bar["high"]
+            self.low_prices[-1], self.close_prices[-1] = bar["low"], bar["close"]
+            self.volumes[-1] = bar["volume"]
+        else:
+            resized = True
+            self.live_base = None
+            # A new bar is rare (once per resolution interval), so growing the arrays by copy is fine
+            self.timestamps = np.append(self.timestamps, bar["timestamp"])
+            self.open_prices = np.append(self.open_prices, bar["open"])
+            self.high_prices = np.append(self.high_prices, bar["high"])
+            self.low_prices = np.append(self.low_prices, bar["low"])
+            self.close_prices = np.append(self.close_prices, bar["close"])
+            self.volumes = np.append(self.volumes, bar["volume"])
+        self.update_overlay_tail(appended)
+
+        if resized:
+            # The table reads the tab's own arrays, so it only needs re-pointing when they are replaced
+            self.candle_table.update_data([self.timestamps, self.open_prices, self.high_prices, self.low_prices,
+                                           self.close_prices, self.volumes])
+        else:
+            self.candle_table.refresh_from(len(self.timestamps) - 1)
+
+        # Only plots whose visible range reaches the live bar need a new level of detail
+        edge = self.timestamps[max(len(self.timestamps) - 2, 0)]
+        for axis in ("fyers_line_x", "fyers_candle_x"):
+            if dpg.get_axis_limits(axis)[1] >= edge:
+                self.plot_limits.pop(axis, None)
+        return True
+
+    def wants_live_bars(self):
+        """True while the tab is on screen showing a range that reaches the bar forming now."""
+        if self.loaded_range_to is None or len(self.timestamps) == 0:
+            return False
+        if self.loaded_range_to < time.time() - resolution_seconds(self.resolution):
+            return False
+        return dpg.does_item_exist("fyers_status") and dpg.is_item_visible("fyers_status")
+
+    def check_live_feed(self):
+        """Hold the live feed for the charted symbol while live bars can extend it; release it once idle."""
+        now = time.time()
+        if self.wants_live_bars():
+            self.feed_shown_at = now
+            if self.feed_symbol is None:
+                feed.acquire()
+            if self.feed_symbol != self.symbol:
+                self.feed_symbol = self.symbol
+                feed.subscriptions.set_symbols([self.symbol], owner="fyers_data")
+        elif self.feed_symbol is not None and now - self.feed_shown_at > IDLE_TEARDOWN_SECONDS:
+            feed.subscriptions.set_symbols([], owner="fyers_data")
+            self.feed_symbol = None
+            feed.release()
+        if self.feed_symbol is not None:
+            feed.check_token()  # Reconnect with a new token after login or refresh
+
+    def visible_slice(self, x_range):
+        """Index range of candles inside `x_range`, padded by one so lines reach the plot edges."""
+        lo = max(int(np.searchsorted(self.timestamps, x_range[0])) - 1, 0)
+        hi = min(int(np.searchsorted(self.timestamps, x_range[1], side="right")) + 1, len(self.timestamps))
+        return slice(lo, hi)
+
+    def plot_width(self, plot):
+        """Plot width in pixels, falling back to a typical width before the first frame is laid out."""
+        width = dpg.get_item_rect_size(plot)[0]
+        return width if width > 0 else 1600
+
+    def update_line_lod(self, x_range):
+        """Recompute the LTTB-decimated subset for the four line series over the visible range."""
+        visible = self.visible_slice(x_range)
+        max_points = self.plot_width("fyers_line_plot")
+        x = self.timestamps[visible]
+        for tag, prices in (("open_series", self.open_prices), ("high_series", self.high_prices),
+                            ("low_series", self.low_prices), ("close_series", self.close_prices)):
+            line_x, line_y = lttb(x, prices[visible], max_points)
+            dpg.configure_item(tag, x=line_x.tolist(), y=line_y.tolist())
+
+    def update_candle_lod(self, x_range):
+        """Merge visible candles so there are never more bars than a few pixels each can show."""
+        visible = self.visible_slice(x_range)
+        max_bars = max(self.plot_width("fyers_candle_plot") // 3, 1)
+        dates, opens, highs, lows, closes = decimate_ohlc(
+            self.timestamps[visible], self.open_prices[visible], self.high_prices[visible],
+            self.low_prices[visible], self.close_prices[visible], max_bars)
+        dpg.configure_item("ohlc_series", dates=dates.tolist(), opens=opens.tolist(), closes=closes.tolist(),
+                           lows=lows.tolist(), highs=highs.tolist())
+
+        x = self.timestamps[visible]
+        for tag, values in self.overlays.items():
+            values = values[visible]
+            valid = ~np.isnan(values)  # Skip the indicator's warm-up bars
+            line_x, line_y = lttb(x[valid], values[valid], max_bars * 3)
+            dpg.configure_item(tag, x=line_x.tolist(), y=line_y.tolist())
+
+    def on_frame(self):
+        """Deliver background fetch results and recompute plot detail after zoom/pan. Called from the render loop."""
+        self.tasks.poll()
+        self.check_live_feed()
+        if len(self.timestamps) == 0 or not dpg.does_item_exist("fyers_line_x"):
+            return
+        now = time.time()
+        if now - self.live_applied_at >= LIVE_REFRESH_SECONDS:
+            self.live_applied_at = now
+            self.apply_live_bar()
+        for plot, axis, update in (("fyers_line_plot", "fyers_line_x", self.update_line_lod),
+                                   ("fyers_candle_plot", "fyers_candle_x", self.update_candle_lod)):
+            if not dpg.is_item_visible(plot):
+                continue  # Collapsed or off screen; its limits stay stale so it is recomputed once shown
+            limits = tuple(dpg.get_axis_limits(axis))
+            if limits[1] <= limits[0] or self.plot_limits.get(axis) == limits:
+                continue
+            self.plot_limits[axis] = limits
+            update(limits)
 
     def FyersTab(self):
         """Create the Fyers Data tab in DearPyGui."""
         with dpg.tab(label="Fyers Data"):
             dpg.add_text("📈 Fyers Historical Market Data", color=(0, 255, 255))
-            dpg.add_button(label="Fetch Data", callback=self.display_fyers_data)
+            with dpg.group(horizontal=True):
+                dpg.add_input_text(label="Symbol", tag="fyers_symbol", default_value=self.symbol, width=160)
+                dpg.add_combo(HISTORY_RESOLUTIONS, label="Resolution", tag="fyers_resolution",
+                              default_value=self.resolution, width=60)
+                # Long ranges are split into legal windows and downloaded concurrently
+                dpg.add_input_text(label="From", tag="fyers_range_from", default_value=self.range_from, width=160,
+                                   hint="YYYY-MM-DD [HH:MM] or epoch")
+                dpg.add_input_text(label="To", tag="fyers_range_to", default_value=self.range_to, width=160,
+                                   hint="YYYY-MM-DD [HH:MM] or epoch")
+            with dpg.group(horizontal=True):
+                dpg.add_button(label="Fetch Data", callback=self.display_fyers_data)
+                dpg.add_button(label="Cancel", callback=self.cancel_fetch)
             dpg.add_separator()
             dpg.add_text("", tag="fyers_status")  # Status message
 
             # Table for historical data
-            with dpg.table(header_row=True, tag="fyers_table", row_background=True, hideable=True, resizable=True):
-                dpg.add_table_column(label="Timestamp", width_stretch=True)
-                dpg.add_table_column(label="Open", width_stretch=True)
-                dpg.add_table_column(label="High", width_stretch=True)
-                dpg.add_table_column(label="Low", width_stretch=True)
-                dpg.add_table_column(label="Close", width_stretch=True)
-                dpg.add_table_column(label="Volume", width_stretch=True)
+            self.candle_table.build()
 
             dpg.add_separator()
             dpg.add_text("📊 Price Chart", color=(0, 255, 255))
@@ -114,10 +406,10 @@ class FyersDataTab:
             # Create plots for Open, High, Low, Close data
             with dpg.collapsing_header(label="Line Chart"):
 
-                with dpg.plot(label="Stock Prices", height=300, width=-1):
+                with dpg.plot(label="Stock Prices", height=300, width=-1, tag="fyers_line_plot"):
                     dpg.add_plot_legend()
-                    dpg.add_plot_axis(dpg.mvXAxis, label="Timestamp")
-                    with dpg.plot_axis(dpg.mvYAxis, label="Price"):
+                    dpg.add_plot_axis(dpg.mvXAxis, label="Timestamp", tag="fyers_line_x")
+                    with dpg.plot_axis(dpg.mvYAxis, label="Price", tag="fyers_line_y"):
                         dpg.add_line_series([], [], label="Open", tag="open_series")
                         dpg.add_line_series([], [], label="High", tag="high_series")
                         dpg.add_line_series([], [], label="Low", tag="low_series")
@@ -126,8 +418,12 @@ class FyersDataTab:
             # Create a candlestick (OHLC) chart
             with dpg.collapsing_header(label="Candlestick Chart"):
 
-                with dpg.plot(label="OHLC Chart", height=400, width=-1):
+                with dpg.plot(label="OHLC Chart", height=400, width=-1, tag="fyers_candle_plot"):
                     dpg.add_plot_legend()
-                    dpg.add_plot_axis(dpg.mvXAxis, label="Timestamp")
-                    with dpg.plot_axis(dpg.mvYAxis, label="OHLC Price"):
+                    dpg.add_plot_axis(dpg.mvXAxis, label="Timestamp", tag="fyers_candle_x")
+                    with dpg.plot_axis(dpg.mvYAxis, label="OHLC Price", tag="fyers_candle_y"):
                         dpg.add_candle_series([], [], [], [], [], label="OHLC", tag="ohlc_series")
+                        dpg.add_line_series([], [], label="SMA 20", tag="sma_20_series")
+                        dpg.add_line_series([], [], label="EMA 50", tag="ema_50_series")
+                        dpg.add_line_series([], [], label="BB Upper", tag="bb_upper_series")
+                        dpg.add_line_series([], [], label="BB Lower", tag="bb_lower_series")
@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from FyersAuthentication.FyersClient import clients
+from FyersData.CandleStore import candles_to_columns, merge_columns
+
+# Longest range Fyers accepts in one history call: 100 days for intraday resolutions, 366 for daily
+INTRADAY_MAX_DAYS = 100
+DAILY_MAX_DAYS = 366
+DAILY_RESOLUTIONS = {"D", "1D", "DAY"}
+
+# Fyers API v3 allows 10 requests per second per app
+REQUESTS_PER_SECOND = 10
+MAX_RETRIES = 3
+
+
+def max_window_seconds(resolution):
+    """Longest legal range_from..range_to span, in seconds, for a history resolution."""
+    days = DAILY_MAX_DAYS if str(resolution).upper() in DAILY_RESOLUTIONS else INTRADAY_MAX_DAYS
+    return days * 86400
+
+
+def split_range(range_from, range_to, resolution):
+    """Split an epoch range into consecutive, non-overlapping windows Fyers will accept in one call."""
+    start, end = int(range_from), int(range_to)
+    window = max_window_seconds(resolution)
+    windows = []
+    while start <= end:
+        stop = min(start + window - 1, end)
+        windows.append((start, stop))
+        start = stop + 1
+    return windows
+
+
+class RateLimiter:
+    """Thread-safe token bucket: at most `rate` acquisitions per second, with bursts up to `burst`."""
+
+    def __init__(self, rate=REQUESTS_PER_SECOND, burst=None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by every downloader so concurrent fetches together stay inside the API budget
+rate_limiter = RateLimiter()
+
+
+class HistoryDownloader:
+    """Downloads arbitrarily long candle ranges by fanning legal-sized history calls out over a thread pool.
+
+    Each call leases its own FyersModel from the client registry, since a model shared between workers lets
+    concurrent failures overwrite each other's error response.
+    """
+
+    def __init__(self, client_id, token, max_workers=REQUESTS_PER_SECOND, limiter=None, registry=clients):
+        self.client_id = client_id
+        self.token = token
+        self.max_workers = max_workers
+        self.limiter = limiter or rate_limiter
+        self.registry = registry
+
+    def fetch_window(self, symbol, resolution, window, cancel_token=None):
+        """One history call, retried with backoff when Fyers reports a rate-limit or transport error."""
+        data = {
+            "symbol": symbol,
+            "resolution": resolution,
+            "date_format": "0",
+            "range_from": str(window[0]),
+            "range_to": str(window[1]),
+            "cont_flag": "1"
+        }
+        for attempt in range(MAX_RETRIES + 1):
+            if cancel_token is not None:
+                cancel_token.check()
+            self.limiter.acquire()
+            try:
+                with self.registry.lease(self.client_id, self.token) as fyers:
+                    response = dict(fyers.history(data=data))  # The SDK reuses its error dict between calls
+            except Exception as e:
+                response = {"s": "error", "code": -1, "message": str(e)}
+            if response.get("s") == "ok" or response.get("s") == "no_data":
+                return response
+            if response.get("code") not in (-1, -99, 429, -429) or attempt == MAX_RETRIES:
+                return response
+            time.sleep(0.5 * 2 ** attempt)
+        return response
+
+    def download(self, symbol, resolution, range_from, range_to, cancel_token=None, progress=None):
+        """Fetch [range_from, range_to] for `symbol` and return a single history-style response.
+
+        Candles come back under "columns" as typed NumPy arrays: each window's rows are converted in one
+        pass as soon as they arrive, then stitched and de-duplicated without a per-candle Python loop.
+        The first failing window's response is returned as-is so callers can show its message.
+        """
+        windows = split_range(range_from, range_to, resolution)
+        chunks = [None] * len(windows)
+        failure = None
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(windows), 1)),
+                                thread_name_prefix="history-download") as executor:
+            futures = {executor.submit(self.fetch_window, symbol, resolution, window, cancel_token): i
+                       for i, window in enumerate(windows)}
+            for future in as_completed(futures):
+                response = future.result()  # Re-raises TaskCancelled from a cancelled window
+                done += 1
+                if response.get("s") == "ok":
+                    chunks[futures[future]] = candles_to_columns(response.get("candles", []))
+                elif response.get("s") != "no_data" and failure is None:
+                    failure = response
+                    for pending in futures:
+                        pending.cancel()
+                if progress is not None:
+                    progress(f"Downloaded {done}/{len(windows)} windows for {symbol}")
+
+        if failure is not None:
+            return failure
+        return {"s": "ok", "columns": merge_columns([chunk for chunk in chunks if chunk is not None])}
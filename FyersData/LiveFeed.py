@@ -0,0 +1,161 @@
+import threading
+from fyers_apiv3.FyersWebsocket import data_ws
+from FyersData.MarketPublisher import MarketPublisher
+from FyersData.TickReplay import TickRecorder
+from FyersData.CandleAggregator import aggregator
+from FyersData.SubscriptionManager import SubscriptionManager
+from FyersAuthentication.TokenManager import tokens
+from Utils.LatencyTracer import stamp
+
+# Raw ticks are published on localhost for the stream processor. Keep JSON while
+# StreamProcessing.exe is the consumer; "struct" or "msgpack" cut encode/decode cost.
+PUBLISH_ADDRESS = "tcp://127.0.0.1:5555"
+PUBLISH_CODEC = "json"
+
+# App id used for the socket until a login in this app sets tokens.client_id; the token comes from the token manager
+CLIENT_ID = "FYERS_CLIENT_ID"
+
+# Set to a file path (e.g. "ticks.rec") to record raw ticks for offline replay with FyersData.TickReplay
+RECORD_TICKS_TO = None
+
+# Live resources are released after their consumer has not been shown for this long
+IDLE_TEARDOWN_SECONDS = 60
+
+
+def onerror(message):
+    print("⚠️ WebSocket Error:", message)
+
+
+def onclose(message):
+    print("🔴 WebSocket Disconnected:", message)
+
+
+class LiveFeed:
+    """Fyers WebSocket, ZMQ publisher and subscription manager, created on first use and closed when unused.
+
+    Nothing binds a port or opens a connection at import time. Every consumer acquire()s the feed while it needs
+    ticks (the Live Market tab while shown, the Fyers Data tab while it charts a present-day range) and
+    release()s it when it goes idle; the feed stays up while any consumer holds it.
+
+    The socket is built from the token manager's token and rebuilt by check_token() when that token changes
+    (login, refresh or an edited token file); with no token there is no socket until one arrives.
+    The SDK callbacks are bound to the socket that fires them, so a socket that connects or delivers a message
+    after release() (its connect() sleeps 2 s before calling on_connect) never touches a newer feed.
+    """
+
+    def __init__(self):
+        self.users = 0
+        self.lock = threading.Lock()
+        self.publisher = None
+        self.recorder = None
+        self.fyers = None
+        self.subscriptions = None
+        self.token = None  # Token the current socket was built with
+
+    def acquire(self):
+        with self.lock:
+            self.users += 1
+            if self.users > 1:
+                return self
+            print("🚀 Starting live feed")
+            self.publisher = MarketPublisher(PUBLISH_ADDRESS, codec=PUBLISH_CODEC)
+            self.recorder = TickRecorder(RECORD_TICKS_TO) if RECORD_TICKS_TO else None
+            self.token = tokens.get()
+            self.fyers, self.subscriptions = self.create_socket(self.token)
+            return self
+
+    def create_socket(self, token):
+        """A data socket for `token` and the SubscriptionManager that drives it (socket None without a token)."""
+        if not token:
+            print("⚠️ No Fyers access token yet; the live feed connects after login")
+            return None, SubscriptionManager(None)
+        socket = subscriptions = None
+
+        def onopen():
+            """Subscribe to stock symbols when WebSocket connection is opened."""
+            print("🔗 Connected to Fyers WebSocket. Subscribing to symbols...")
+            subscriptions.on_connected()  # This socket's own manager, even if the feed has moved on
+
+        def onmessage(message):
+            self.on_message(socket, message)
+
+        socket = data_ws.FyersDataSocket(
+            access_token=f"{tokens.client_id or CLIENT_ID}:{token}",
+            log_path="",
+            litemode=False,
+            write_to_file=False,
+            reconnect=True,
+            on_connect=onopen,
+            on_close=onclose,
+            on_error=onerror,
+            on_message=onmessage
+        )
+        # Applies watchlist changes to the socket above in batches, without reconnecting. The GUI keeps the
+        # process alive, so the SDK's keep_running() thread is never started.
+        subscriptions = SubscriptionManager(socket)
+        return socket, subscriptions
+
+    def check_token(self):
+        """Rebuild the socket when the token manager's token has changed. Cheap enough to call every frame."""
+        if self.users == 0 or tokens.get() == self.token:
+            return
+        with self.lock:
+            token = tokens.get()
+            if self.users == 0 or token == self.token:
+                return
+            print("🔑 Access token changed; reconnecting the live feed")
+            socket, subscriptions = self.fyers, self.subscriptions
+            self.token = token
+            self.fyers, self.subscriptions = self.create_socket(token)
+            # Every consumer keeps its symbols on the new socket
+            for owner, symbols in subscriptions.owned().items():
+                self.subscriptions.set_symbols(symbols, owner=owner)
+        threading.Thread(target=self.close_socket, args=(socket, subscriptions), name="fyers-feed-teardown",
+                         daemon=True).start()
+
+    def on_message(self, socket, message):
+        """
+        Callback function to handle incoming WebSocket messages.
+        Sends the processed message to the C++ stream processing framework.
+        """
+        try:
+            #print("📩 Received Market Data:", message)
+            publisher, recorder = self.publisher, self.recorder
+            if publisher is None or self.fyers is not socket:
+                return  # Message from a socket that has been released
+            if recorder is not None:
+                recorder.record(message)
+            aggregator.update(message)  # Live OHLCV bars for the history charts
+            stamp(message, "fyers_recv")
+            publisher.publish(message)
+        except Exception as e:
+            print(f"❌ Error processing message: {e}")
+
+    def release(self):
+        with self.lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            print("💤 Stopping idle live feed")
+            socket, subscriptions = self.fyers, self.subscriptions
+            publisher, recorder = self.publisher, self.recorder
+            self.publisher = self.recorder = None
+            self.fyers = self.subscriptions = self.token = None
+            # Closing the publisher frees its port at once, so a tab shown again can bind it straight away
+            publisher.close()
+            if recorder is not None:
+                recorder.close()
+        # Stopping the subscription worker and the SDK's threads can block for seconds (its ping thread sleeps
+        # 10 s between pings), so it never runs on the render loop
+        threading.Thread(target=self.close_socket, args=(socket, subscriptions), name="fyers-feed-teardown",
+                         daemon=True).start()
+
+    @staticmethod
+    def close_socket(socket, subscriptions):
+        # Wait for a connect() in flight, so the socket cannot open after it has been closed
+        subscriptions.stop(timeout=None)
+        if socket is not None:
+            socket.close_connection()  # No-op when the connection never opened
+
+
+feed = LiveFeed()
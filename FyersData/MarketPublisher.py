@@ -0,0 +1,22 @@
+import zmq
+from FyersData.WireCodec import get_codec
+from Utils.LatencyTracer import stamp
+
+
+class MarketPublisher:
+    """ZeroMQ PUB socket for raw Fyers ticks, published as [symbol topic, encoded payload] multipart messages."""
+
+    def __init__(self, address="tcp://127.0.0.1:5555", codec="json"):
+        self.address = address
+        self.codec = get_codec(codec)  # Every frame on this socket carries the codec's tag byte
+        self.socket = zmq.Context.instance().socket(zmq.PUB)  # PUB socket to allow multiple subscribers
+        self.socket.bind(address)
+
+    def publish(self, message):
+        """Encode and send a single tick without blocking. The symbol topic lets ZMQ filter for subscribers."""
+        topic = message.get("symbol", "").encode()
+        stamp(message, "publish")
+        self.socket.send_multipart([topic, self.codec.encode(message)], zmq.NOBLOCK)
+
+    def close(self):
+        self.socket.close(linger=0)
@@ -1,54 +1,79 @@
-import asyncio
-import zmq
-import zmq.asyncio
-import dearpygui.dearpygui as dpg
-import json
-import threading
-import queue
 import time
+import dearpygui.dearpygui as dpg
+from Utils.RingBufferTable import RingBufferTable
+from FyersData.TickCoalescer import TickCoalescer
+from Utils.LatencyTracer import stamp, tracer
+from FyersData.ZmqReceiver import ZmqBatchReceiver
+
+# The receiver is stopped after the tab has not been shown for this long
+IDLE_TEARDOWN_SECONDS = 60
+
 
 class LiveDataTab:
     """Class to handle real-time market data via ZeroMQ and display in DearPyGui."""
 
-    def __init__(self):
-        """Initialize WebSocket connection and UI components."""
-        self.context = zmq.asyncio.Context()
-        self.socket = self.context.socket(zmq.SUB)
-        self.socket.connect("tcp://127.0.0.1:5556")  # Connect to C++ processed data
-        self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
-
-        # Thread-safe queue to store received messages
-        self.data_queue = queue.Queue()
+    def __init__(self, max_batch=500, high_water_mark=10000, address="tcp://127.0.0.1:5556"):
+        """Initialize the ZeroMQ receiver and UI components."""
+        # Latest tick per symbol, consumed once per frame by the render loop
+        self.coalescer = TickCoalescer()
 
         # Max number of rows in the table before clearing old data
         self.max_rows = 10
-        self.table_rows = []
-
-        # Start WebSocket data listener in a background thread
-        threading.Thread(target=self.start_websocket_listener, daemon=True).start()
-
-    async def receive_data(self):
-        """Asynchronous function to receive processed data from C++ and store it in a queue."""
-        while True:
-            try:
-                message = await self.socket.recv_string()
-                processed_data = json.loads(message)
-                self.data_queue.put(processed_data)  # Store in thread-safe queue
-            except Exception as e:
-                print("Error receiving data:", e)
-            await asyncio.sleep(0.1)  # Adjust the sleep interval as needed
-
-    def start_websocket_listener(self):
-        """Runs the WebSocket listener in an asyncio event loop inside a background thread."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(self.receive_data())
+        self.table = RingBufferTable("live_data_table", num_columns=9, max_rows=self.max_rows)
+
+        # Drain processed data from C++ in non-blocking batches on a background thread,
+        # started only once the tab is shown
+        self.receiver = ZmqBatchReceiver(address, on_message=self.receive_data,
+                                         max_batch=max_batch, high_water_mark=high_water_mark)
+        self.active = False
+        self.pinned = False  # Activated explicitly, so never torn down for being hidden
+        self.last_shown = 0.0
+
+    def activate(self, pinned=False):
+        """Start receiving. Called when the tab becomes visible, or with pinned=True to keep it running headless."""
+        self.pinned = self.pinned or pinned
+        self.last_shown = time.time()
+        if not self.active:
+            self.active = True
+            self.receiver.start()
+
+    def deactivate(self):
+        """Stop receiving; the tab starts again when shown."""
+        if self.active:
+            self.active = False
+            self.pinned = False
+            self.receiver.stop()
+
+    def check_visibility(self):
+        """Activate when the tab is on screen and stop once it has been hidden for IDLE_TEARDOWN_SECONDS."""
+        now = time.time()
+        if dpg.does_item_exist("live_data_table") and dpg.is_item_visible("live_data_table"):
+            self.last_shown = now
+            self.activate()
+        elif self.active and not self.pinned and now - self.last_shown > IDLE_TEARDOWN_SECONDS:
+            self.deactivate()
+
+    def receive_data(self, processed_data):
+        """Called from the receiver thread for every processed message; keeps only the latest tick per symbol."""
+        if "trace" in processed_data:
+            stamp(processed_data, "gui_recv")
+        self.coalescer.push(processed_data)
+
+    def feed_stats(self):
+        """Summarize receiver throughput, coalesced, undecodable and queued counts for display.
+
+        Coalesced ticks were superseded by a newer tick for the same symbol before a frame drew them; they are not
+        losses. Ticks ZMQ discards at the receive high-water mark are not reported by the socket and not shown.
+        """
+        stats = self.receiver.stats()
+        return (f"Received: {stats['received']} | Batches: {stats['batches']} (max {stats['largest_batch']}) | "
+                f"Coalesced: {self.coalescer.coalesced} | Decode errors: {stats['decode_errors']} | "
+                f"Queued: {self.coalescer.pending()}")
 
     def update_table(self):
-        """Fetches processed data from the queue and updates the Dear PyGui table safely in the main thread."""
-        while not self.data_queue.empty():
-            processed_data = self.data_queue.get()
-
+        """Applies the latest tick per symbol to the table. Called once per frame from the main render loop."""
+        self.check_visibility()
+        for processed_data in self.coalescer.drain():
             # Format row data
             row = [
                 processed_data.get("symbol", "N/A"),
@@ -56,32 +81,27 @@ class LiveDataTab:
                 str(processed_data.get("ask_price", "N/A")),
                 str(processed_data.get("bid_size", "N/A")),
                 str(processed_data.get("ask_size", "N/A")),
-                processed_data.get("order_book_prediction", "N/A"),
-                processed_data.get("order_flow_prediction", "N/A"),
-                processed_data.get("signal", "N/A"),
+                str(processed_data.get("order_book_prediction", "N/A")),
+                str(processed_data.get("order_flow_prediction", "N/A")),
+                str(processed_data.get("signal", "N/A")),
                 f"{processed_data.get('processing_time_ms', 0):.2f} ms",
             ]
 
-            # Append to table, limit rows
-            self.table_rows.append(row)
-            if len(self.table_rows) > self.max_rows:
-                self.table_rows.pop(0)  # Remove the oldest row
-
-            # Safe UI update
-            if dpg.does_item_exist("live_data_table"):
-                #dpg.delete_item("live_data_table", children_only=True)
+            # Append to the ring buffer; the oldest row is overwritten once full
+            self.table.append(row)
+            tracer.applied(processed_data)  # Latency trace is closed once the frame is rendered
 
-                # Add rows
-                for row_data in self.table_rows:
-                    with dpg.table_row(parent="live_data_table"):
-                        for value in row_data:
-                            dpg.add_text(value)
+        # Safe UI update: refresh the pre-created rows in place
+        if dpg.does_item_exist("live_data_table"):
+            self.table.render()
+            dpg.set_value("live_feed_stats", self.feed_stats())
 
     def LiveDataTabUI(self):
         """Creates the Live Data tab in DearPyGui, callable from dashboard."""
         with dpg.tab(label="Live Market Data"):
             dpg.add_text("📊 Real-Time Market Data", color=(0, 255, 255))
             dpg.add_separator()
+            dpg.add_text("", tag="live_feed_stats")
 
             # Table for live data
             with dpg.table(header_row=True, tag="live_data_table", row_background=True, hideable=True, resizable=True, scrollY=True):
@@ -94,6 +114,7 @@ class LiveDataTab:
                 dpg.add_table_column(label="Order Flow Prediction", width_stretch=True)
                 dpg.add_table_column(label="Signal", width_stretch=True)
                 dpg.add_table_column(label="Processing Time", width_stretch=True)
+                self.table.build()
 
             dpg.add_separator()
 
@@ -108,12 +129,3 @@ class LiveDataTab:
                     with dpg.plot_axis(dpg.mvYAxis, label="Price"):
                         dpg.add_line_series([], [], label="Bid Price", tag="bid_series")
                         dpg.add_line_series([], [], label="Ask Price", tag="ask_series")
-
-        # Start auto-updating table in background thread
-        threading.Thread(target=self.auto_update_table, daemon=True).start()
-
-    def auto_update_table(self):
-        """Continuously updates the table every 100ms in the main UI thread."""
-        while True:
-            self.update_table()
-            time.sleep(0.1)  # Refresh every 100ms
@@ -1,100 +1,103 @@
-import asyncio
-import zmq
-import zmq.asyncio
-import dearpygui.dearpygui as dpg
-import json
+import sys
 import threading
-import queue
 import time
-from fyers_apiv3.FyersWebsocket import data_ws
-
-# Initialize ZeroMQ context and PUB socket
-context = zmq.Context()
-socket = context.socket(zmq.PUB)  # PUB socket to allow multiple subscribers
-socket.bind("tcp://127.0.0.1:5555")  # Publishing data on localhost
-
-# Fyers WebSocket Authentication (Replace with actual access token)
-access_token = "REPLACE_YOUR_ACCESS_TOKEN"
-
-# Global variable to store user input symbol
+import dearpygui.dearpygui as dpg
+from Utils.RingBufferTable import RingBufferTable
+from FyersData.TickCoalescer import TickCoalescer
+from Utils.LatencyTracer import stamp, tracer
+from Utils.LatencyPanel import LatencyPanel
+from Utils.StreamingSeries import StreamingLineSeries
+from FyersData.ZmqReceiver import ZmqBatchReceiver
+from FyersData.StreamProcessor import StreamStage
+from FyersData.LiveFeed import feed, IDLE_TEARDOWN_SECONDS
+
+# StreamProcessing.exe only exists for Windows; elsewhere run the Python processor inside the GUI process
+IN_PROCESS_PROCESSOR = sys.platform != "win32"
+
+# Seconds of bid/ask history kept on the live trend chart (one trading session)
+CHART_LOOKBACK_SECONDS = 6.5 * 3600
+
+# Global variable to store user input symbol (the one charted; every watchlist symbol fills the table)
 user_symbol = "NSE:SBIN-EQ"
 
 
-def onmessage(message):
-    """
-    Callback function to handle incoming WebSocket messages.
-    Sends the processed message to the C++ stream processing framework.
-    """
-    try:
-        #print("📩 Received Market Data:", message)
-        json_data = json.dumps(message)
-        socket.send_string(json_data)
-        #print("✅ Sent Data to C++:", json_data)
-    except Exception as e:
-        print(f"❌ Error processing message: {e}")
-
-
-def onerror(message):
-    print("⚠️ WebSocket Error:", message)
-
-
-def onclose(message):
-    print("🔴 WebSocket Disconnected:", message)
-
-
-def onopen():
-    """Subscribe to stock symbols when WebSocket connection is opened."""
-    print("🔗 Connected to Fyers WebSocket. Subscribing to symbols...")
-    data_type = "SymbolUpdate"
-    fyers.subscribe(symbols=[user_symbol], data_type=data_type)
-    fyers.keep_running()
-
-
-# Initialize Fyers WebSocket Client
-fyers = data_ws.FyersDataSocket(
-    access_token=access_token,
-    log_path="",
-    litemode=False,
-    write_to_file=False,
-    reconnect=True,
-    on_connect=onopen,
-    on_close=onclose,
-    on_error=onerror,
-    on_message=onmessage
-)
-
-
 class LiveDataTab:
-    def __init__(self):
-        self.context = zmq.asyncio.Context()
-        self.socket = self.context.socket(zmq.SUB)
-        self.socket.connect("tcp://127.0.0.1:5556")
-        self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
-        self.data_queue = queue.Queue()
-        self.max_rows = 10
-        self.table_rows = []
-        threading.Thread(target=self.start_websocket_listener, daemon=True).start()
-
-    async def receive_data(self):
-        while True:
-            try:
-                message = await self.socket.recv_string()
-                processed_data = json.loads(message)
-                self.data_queue.put(processed_data)
-            except Exception as e:
-                print("Error receiving data:", e)
-            await asyncio.sleep(0.1)
-
-    def start_websocket_listener(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(self.receive_data())
+    def __init__(self, max_batch=500, high_water_mark=10000, address="tcp://127.0.0.1:5556",
+                 chart_lookback=CHART_LOOKBACK_SECONDS):
+        # The processor, receiver and live feed start when the tab is first shown (see activate)
+        self.stream_stage = StreamStage() if IN_PROCESS_PROCESSOR else None
+        self.state_lock = threading.Lock()  # activate() runs from both the render loop and item callbacks
+        self.active = False
+        self.pinned = False  # Activated explicitly, so never torn down for being hidden
+        self.last_shown = 0.0
+        self.watchlist = [user_symbol]
+        self.coalescer = TickCoalescer()
+        self.max_rows = 20
+        self.table = RingBufferTable("live_data_table", num_columns=9, max_rows=self.max_rows)
+        self.latency_panel = LatencyPanel()
+        self.bid_series = StreamingLineSeries("bid_series", lookback=chart_lookback)
+        self.ask_series = StreamingLineSeries("ask_series", lookback=chart_lookback)
+        # Only the displayed symbol is subscribed; ZMQ filters the other topics before they reach Python
+        self.receiver = ZmqBatchReceiver(address, on_message=self.receive_data,
+                                         max_batch=max_batch, high_water_mark=high_water_mark,
+                                         topics=[user_symbol])
+
+    def activate(self, pinned=False):
+        """Start the processor, receiver and Fyers feed when the tab becomes visible (pinned=True keeps them running)."""
+        with self.state_lock:
+            self.pinned = self.pinned or pinned
+            self.last_shown = time.time()
+            if self.active:
+                return
+            self.active = True
+            if self.stream_stage is not None:
+                self.stream_stage.start()
+            self.receiver.start()
+            feed.acquire().subscriptions.set_symbols(self.watchlist, owner="live_market")
+
+    def deactivate(self):
+        """Stop everything activate() started; the tab restarts it when shown again."""
+        with self.state_lock:
+            if not self.active:
+                return
+            self.active = False
+            self.pinned = False
+            self.receiver.stop()
+            if self.stream_stage is not None:
+                self.stream_stage.stop()
+            feed.release()
+
+    def check_visibility(self):
+        """Activate when the tab is on screen and release the feed once it has been hidden for a while."""
+        now = time.time()
+        if dpg.does_item_exist("live_data_table") and dpg.is_item_visible("live_data_table"):
+            self.last_shown = now
+            self.activate()
+        elif self.active and not self.pinned and now - self.last_shown > IDLE_TEARDOWN_SECONDS:
+            self.deactivate()
+        if self.active:
+            feed.check_token()  # Reconnect with a new token after login or refresh
+
+    def receive_data(self, processed_data):
+        """Runs on the receiver thread for every tick."""
+        if "trace" in processed_data:
+            stamp(processed_data, "gui_recv")
+        # The chart gets every tick, so spikes between frames survive min/max decimation; the table is coalesced
+        if processed_data.get("symbol") == user_symbol:
+            now = time.time()
+            self.bid_series.append(now, processed_data.get("bid_price", 0.0))
+            self.ask_series.append(now, processed_data.get("ask_price", 0.0))
+        self.coalescer.push(processed_data)
+
+    def feed_stats(self):
+        stats = self.receiver.stats()
+        return (f"Received: {stats['received']} | Batches: {stats['batches']} (max {stats['largest_batch']}) | "
+                f"Coalesced: {self.coalescer.coalesced} | Decode errors: {stats['decode_errors']} | "
+                f"Queued: {self.coalescer.pending()}")
 
     def update_table(self):
-        while not self.data_queue.empty():
-            processed_data = self.data_queue.get()
-            print(processed_data)  # Debugging
-
+        self.check_visibility()
+        for processed_data in self.coalescer.drain():
             row = [
                 processed_data.get("symbol", "N/A"),
                 str(processed_data.get("bid_price", "N/A")),
@@ -107,19 +110,30 @@ class LiveDataTab:
                 f"{processed_data.get('processing_time_ms', 0):.2f} ms",
             ]
 
-            # Ensure table exists before modifying
-            if dpg.does_item_exist("live_data_table"):
-                # Get current children (rows) of the table
-                current_rows = dpg.get_item_children("live_data_table", 1)
-
-                # If there are 10 or more rows, delete the oldest (first) one
-                if len(current_rows) >= 20:
-                    dpg.delete_item(current_rows[0])
-
-                # Add new row
-                with dpg.table_row(parent="live_data_table"):
-                    for value in row:
-                        dpg.add_text(value)
+            # Only the ring buffer is written per tick; widgets are refreshed once below
+            self.table.append(row)
+            tracer.applied(processed_data)
+
+        # Ensure table exists before modifying
+        if dpg.does_item_exist("live_data_table"):
+            self.table.render()
+            dpg.set_value("live_feed_stats", self.feed_stats())
+            self.latency_panel.refresh()
+            self.update_chart()
+
+    def update_chart(self):
+        """Push the buffered bid/ask windows to the trend chart, decimated to the plot width."""
+        width = dpg.get_item_rect_size("live_trend_plot")[0]
+        bid_changed = self.bid_series.flush(width)
+        ask_changed = self.ask_series.flush(width)
+        if (bid_changed or ask_changed) and dpg.get_value("live_trend_autofit"):
+            dpg.fit_axis_data("live_trend_x")
+            dpg.fit_axis_data("live_trend_y")
+
+    def on_chart_input(self, sender, app_data):
+        """Zooming or panning the trend chart stops auto-fit so the view stays where the user put it."""
+        if dpg.does_item_exist("live_trend_plot") and dpg.is_item_hovered("live_trend_plot"):
+            dpg.set_value("live_trend_autofit", False)
 
     def LiveDataTabUI(self):
         global user_symbol
@@ -128,29 +142,30 @@ class LiveDataTab:
             dpg.add_text("📊 Real-Time Market Data", color=(0, 255, 255))
             dpg.add_separator()
 
-            # Input Field and Button to Update Symbol
+            # Input Field and Button to Update Symbols
             def update_symbol():
                 global user_symbol
 
-                new_symbol = dpg.get_value("symbol_input")
-
-                # Unsubscribe from the previous symbol
-                print(f"🔄 Unsubscribing from {user_symbol}")
-                fyers.unsubscribe(symbols=[user_symbol], data_type="SymbolUpdate")
-
-                # Update to new symbol
-                user_symbol = new_symbol
-                print(f"✅ Subscribing to {user_symbol}")
-
-                # Subscribe to the new symbol
-                fyers.subscribe(symbols=[user_symbol], data_type="SymbolUpdate")
-
-                # Restart WebSocket connection to apply changes
-                fyers.connect()
-
-            dpg.add_input_text(label="Enter Symbol", tag="symbol_input", default_value=user_symbol)
+                # Comma separated watchlist; the manager diffs it against the live subscriptions
+                self.activate()
+                symbols = feed.subscriptions.set_symbols(dpg.get_value("symbol_input").split(","),
+                                                         owner="live_market")
+                if not symbols:
+                    return
+                self.watchlist = symbols
+                print(f"✅ Watching {len(symbols)} symbols")
+
+                # The first symbol is charted
+                if symbols[0] != user_symbol:
+                    user_symbol = symbols[0]
+                    self.bid_series.clear()
+                    self.ask_series.clear()
+                self.receiver.set_topics(symbols)
+
+            dpg.add_input_text(label="Enter Symbols (comma separated)", tag="symbol_input", default_value=user_symbol)
             dpg.add_button(label="Fetch Data", callback=update_symbol)
             dpg.add_separator()
+            dpg.add_text("", tag="live_feed_stats")
 
             with dpg.table(header_row=True, tag="live_data_table", row_background=True, hideable=True, resizable=True,
                            scrollY=True):
@@ -163,34 +178,37 @@ class LiveDataTab:
                 dpg.add_table_column(label="Order Flow Prediction", width_stretch=True)
                 dpg.add_table_column(label="Signal", width_stretch=True)
                 dpg.add_table_column(label="Processing Time", width_stretch=True)
+                self.table.build()
 
             dpg.add_separator()
             dpg.add_text("📈 Market Trends", color=(0, 255, 255))
 
             with dpg.collapsing_header(label="Live Trend Charts"):
-                with dpg.plot(label="Price Trends", height=300, width=-1):
+                dpg.add_checkbox(label="Auto-fit", tag="live_trend_autofit", default_value=True)
+                with dpg.handler_registry():
+                    dpg.add_mouse_wheel_handler(callback=self.on_chart_input)
+                    dpg.add_mouse_drag_handler(callback=self.on_chart_input)
+                with dpg.plot(label="Price Trends", height=300, width=-1, tag="live_trend_plot"):
                     dpg.add_plot_legend()
-                    dpg.add_plot_axis(dpg.mvXAxis, label="Timestamp")
-                    with dpg.plot_axis(dpg.mvYAxis, label="Price"):
+                    dpg.add_plot_axis(dpg.mvXAxis, label="Timestamp", tag="live_trend_x")
+                    with dpg.plot_axis(dpg.mvYAxis, label="Price", tag="live_trend_y"):
                         dpg.add_line_series([], [], label="Bid Price", tag="bid_series")
                         dpg.add_line_series([], [], label="Ask Price", tag="ask_series")
 
-        threading.Thread(target=self.auto_update_table, daemon=True).start()
-
-    def auto_update_table(self):
-        while True:
-            self.update_table()
-            time.sleep(0.1)
+            self.latency_panel.build()
 
 
 if __name__ == "__main__":
     print("🚀 Starting Fyers Live Data Stream...")
-    fyers.connect()
     dpg.create_context()
     live_data_tab = LiveDataTab()
     live_data_tab.LiveDataTabUI()
     dpg.create_viewport(title="Live Market Data", width=1000, height=600)
     dpg.setup_dearpygui()
     dpg.show_viewport()
-    dpg.start_dearpygui()
+    while dpg.is_dearpygui_running():
+        live_data_tab.update_table()
+        dpg.render_dearpygui_frame()
+        tracer.frame_rendered()
+    live_data_tab.deactivate()
     dpg.destroy_context()
@@ -3,16 +3,71 @@
 #include <string>
 #include <nlohmann/json.hpp>
 #include <chrono>
-#include <vector>
-#include <numeric>  // For std::accumulate
+#include <array>
+#include <unordered_map>
+#include <list>
 
 using json = nlohmann::json;
 
 // Limit the number of stored data points for efficient calculations
 constexpr size_t MAX_DATA_POINTS = 50;
 
-// Storage for rolling calculations
-std::vector<double> bid_ask_spreads, bid_ask_imbalances, order_flows;
+// Bounds memory like the Python processor's max_symbols; the least recently updated symbol is recycled beyond it
+constexpr size_t MAX_SYMBOLS = 10000;
+
+// Fixed-size ring buffer with a running sum, so each update is O(1)
+struct RollingWindow {
+    std::array<double, MAX_DATA_POINTS> values{};
+    size_t index = 0;
+    size_t count = 0;
+    double total = 0.0;
+
+    double push(double value) {
+        if (count == MAX_DATA_POINTS) total -= values[index];
+        else ++count;
+        values[index] = value;
+        total += value;
+        index = (index + 1) % MAX_DATA_POINTS;
+        return total / count;
+    }
+};
+
+// Rolling statistics are kept per symbol so streamed symbols never blend together
+struct SymbolState {
+    RollingWindow bid_ask_spreads, bid_ask_imbalances, order_flows;
+    std::list<std::string>::iterator recency;  // This symbol's entry in SymbolStates::order
+};
+
+// Per-symbol state with least-recently-updated eviction, O(1) per tick
+struct SymbolStates {
+    std::unordered_map<std::string, SymbolState> states;
+    std::list<std::string> order;  // Most recently updated symbol first
+
+    SymbolState &get(const std::string &symbol) {
+        auto found = states.find(symbol);
+        if (found != states.end()) {
+            order.splice(order.begin(), order, found->second.recency);
+            return found->second;
+        }
+        if (states.size() >= MAX_SYMBOLS) {
+            // Recycle the stalest symbol so memory stays bounded
+            states.erase(order.back());
+            order.pop_back();
+        }
+        order.push_front(symbol);
+        SymbolState &state = states[symbol];
+        state.recency = order.begin();
+        return state;
+    }
+};
+
+SymbolStates symbol_states;
+
+// Monotonic nanoseconds; steady_clock shares its clock with Python's time.perf_counter_ns() on the same host
+inline long long monotonic_ns() {
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now().time_since_epoch()).count();
+}
 
 int main() {
     zmq::context_t context(1);
@@ -23,10 +78,8 @@ int main() {
     receiver.setsockopt(ZMQ_SUBSCRIBE, "", 0);
     sender.bind("tcp://127.0.0.1:5556");
 
-    // Reserve space to avoid repeated allocations
-    bid_ask_spreads.reserve(MAX_DATA_POINTS);
-    bid_ask_imbalances.reserve(MAX_DATA_POINTS);
-    order_flows.reserve(MAX_DATA_POINTS);
+    // Reserve buckets to avoid rehashing as symbols are added
+    symbol_states.states.reserve(1024);
 
     std::cout << "✅ C++ Stream Processor Started. Waiting for incoming live data...\n";
 
@@ -38,7 +91,13 @@ int main() {
             continue;  // Skip loop iteration if no message is available
         }
 
+        // Publishers send [symbol topic, payload]; the payload is always the last frame
+        while (request.more()) {
+            if (!receiver.recv(request, zmq::recv_flags::none)) break;
+        }
+
         std::string received_data(static_cast<char*>(request.data()), request.size());
+        const long long proc_in_ns = monotonic_ns();
 
         try {
             // Fast JSON parsing
@@ -60,19 +119,12 @@ int main() {
             const double bid_ask_imbalance = bid_size - ask_size;
             const double order_flow = tot_buy_qty - tot_sell_qty;
 
-            // Store values in limited-size vectors
-            if (bid_ask_spreads.size() >= MAX_DATA_POINTS) bid_ask_spreads.erase(bid_ask_spreads.begin());
-            if (bid_ask_imbalances.size() >= MAX_DATA_POINTS) bid_ask_imbalances.erase(bid_ask_imbalances.begin());
-            if (order_flows.size() >= MAX_DATA_POINTS) order_flows.erase(order_flows.begin());
-
-            bid_ask_spreads.push_back(bid_ask_spread);
-            bid_ask_imbalances.push_back(bid_ask_imbalance);
-            order_flows.push_back(order_flow);
-
-            // Compute mean values using std::accumulate (faster than loop)
-            const double mean_spread = std::accumulate(bid_ask_spreads.begin(), bid_ask_spreads.end(), 0.0) / bid_ask_spreads.size();
-            const double mean_imbalance = std::accumulate(bid_ask_imbalances.begin(), bid_ask_imbalances.end(), 0.0) / bid_ask_imbalances.size();
-            const double mean_order_flow = std::accumulate(order_flows.begin(), order_flows.end(), 0.0) / order_flows.size();
+            // Update this symbol's rolling windows and read back the means
+            const std::string symbol = market_data.value("symbol", "N/A");
+            SymbolState &state = symbol_states.get(symbol);
+            const double mean_spread = state.bid_ask_spreads.push(bid_ask_spread);
+            const double mean_imbalance = state.bid_ask_imbalances.push(bid_ask_imbalance);
+            state.order_flows.push(order_flow);
 
             // Determine predictions with reduced branching overhead
             std::string order_book_prediction = "Neutral 📊";
@@ -94,7 +146,7 @@ int main() {
 
             // Construct processed JSON object
             json processed_data = {
-                {"symbol", market_data.value("symbol", "N/A")},
+                {"symbol", symbol},
                 {"bid_price", bid_price},
                 {"ask_price", ask_price},
                 {"bid_size", bid_size},
@@ -107,9 +159,19 @@ int main() {
                 {"processing_time_ms", elapsed.count()}
             };
 
-            // Convert JSON to string for sending
+            // Pass the latency trace through with processor timestamps added
+            if (market_data.contains("trace") && market_data["trace"].is_object()) {
+                json trace = market_data["trace"];
+                trace["proc_in"] = proc_in_ns;
+                trace["proc_out"] = monotonic_ns();
+                processed_data["trace"] = trace;
+            }
+
+            // Convert JSON to string for sending, prefixed with the symbol topic so GUI subscribers filter by symbol
             std::string processed_json_str = processed_data.dump();
+            zmq::message_t topic_message(symbol.begin(), symbol.end());
             zmq::message_t processed_message(processed_json_str.begin(), processed_json_str.end());
+            sender.send(topic_message, zmq::send_flags::sndmore);
             sender.send(processed_message, zmq::send_flags::dontwait);
 
             // Print processed data
@@ -0,0 +1,237 @@
+import argparse
+import threading
+import time
+import numpy as np
+import zmq
+from FyersData.WireCodec import decode_message, get_codec
+from Utils.LatencyTracer import stamp
+
+# Limit the number of stored data points for rolling calculations (same as StreamProcessing.cpp)
+MAX_DATA_POINTS = 50
+
+
+# Rolling metrics tracked per symbol: bid-ask spread, bid-ask imbalance, order flow
+NUM_METRICS = 3
+
+
+class SymbolAnalytics:
+    """Per-symbol rolling windows in preallocated NumPy arrays, with O(1) running sums per tick."""
+
+    def __init__(self, window=MAX_DATA_POINTS, initial_symbols=64, max_symbols=10000):
+        self.window = window
+        self.max_symbols = max_symbols  # Bounds memory; the least recently updated symbol is recycled beyond it
+        self.slots = {}  # symbol -> row in the arrays below
+        self.owners = []  # row -> symbol
+        self._allocate(initial_symbols)
+        self.ticks = 0
+
+    def _allocate(self, capacity):
+        """Create (or grow) the state arrays, keeping existing rows."""
+        old = getattr(self, "values", None)
+        self.capacity = capacity
+        values = np.zeros((capacity, NUM_METRICS, self.window), dtype=np.float64)
+        totals = np.zeros((capacity, NUM_METRICS), dtype=np.float64)
+        index = np.zeros(capacity, dtype=np.int64)
+        count = np.zeros(capacity, dtype=np.int64)
+        last_tick = np.zeros(capacity, dtype=np.int64)
+        if old is not None:
+            used = len(old)
+            values[:used] = self.values
+            totals[:used] = self.totals
+            index[:used] = self.index
+            count[:used] = self.count
+            last_tick[:used] = self.last_tick
+        self.values, self.totals, self.index, self.count, self.last_tick = values, totals, index, count, last_tick
+
+    def _slot(self, symbol):
+        slot = self.slots.get(symbol)
+        if slot is not None:
+            return slot
+
+        if len(self.slots) < self.capacity:
+            slot = len(self.slots)
+        elif self.capacity < self.max_symbols:
+            slot = len(self.slots)
+            self._allocate(min(self.capacity * 2, self.max_symbols))
+        else:
+            # Recycle the stalest symbol's row so memory stays bounded
+            slot = int(np.argmin(self.last_tick))
+            del self.slots[self.owners[slot]]
+            self.values[slot] = 0.0
+            self.totals[slot] = 0.0
+            self.index[slot] = 0
+            self.count[slot] = 0
+
+        self.slots[symbol] = slot
+        if slot == len(self.owners):
+            self.owners.append(symbol)
+        else:
+            self.owners[slot] = symbol
+        return slot
+
+    def push(self, symbol, metrics):
+        """Add one (spread, imbalance, order flow) sample for `symbol` and return the window means."""
+        slot = self._slot(symbol)
+        self.ticks += 1
+        self.last_tick[slot] = self.ticks
+
+        position = self.index[slot]
+        window = self.values[slot]
+        totals = self.totals[slot]
+        if self.count[slot] == self.window:
+            totals -= window[:, position]
+        else:
+            self.count[slot] += 1
+        window[:, position] = metrics
+        totals += metrics
+
+        position = (position + 1) % self.window
+        self.index[slot] = position
+        # Re-sum once per full lap so floating point drift from add/subtract cannot accumulate
+        if position == 0:
+            totals[:] = window.sum(axis=1)
+        return totals / self.count[slot]
+
+
+class StreamProcessor:
+    """Python port of StreamProcessing.cpp: rolling spread, imbalance and order-flow means with buy/sell signals."""
+
+    def __init__(self, window=MAX_DATA_POINTS, max_symbols=10000):
+        # Statistics are kept per symbol so several streamed symbols never blend into one window
+        self.analytics = SymbolAnalytics(window, max_symbols=max_symbols)
+
+    def process(self, market_data):
+        """Compute the processed tick for one raw SymbolUpdate message."""
+        start_time = time.perf_counter()
+
+        bid_price = market_data.get("bid_price", 0.0)
+        ask_price = market_data.get("ask_price", 0.0)
+        bid_size = market_data.get("bid_size", 0.0)
+        ask_size = market_data.get("ask_size", 0.0)
+        tot_buy_qty = market_data.get("tot_buy_qty", 0.0)
+        tot_sell_qty = market_data.get("tot_sell_qty", 0.0)
+
+        # Compute bid-ask spread, imbalance, and order flow
+        bid_ask_spread = ask_price - bid_price
+        bid_ask_imbalance = bid_size - ask_size
+        order_flow = tot_buy_qty - tot_sell_qty
+
+        symbol = market_data.get("symbol", "N/A")
+        mean_spread, mean_imbalance, _ = self.analytics.push(symbol, (bid_ask_spread, bid_ask_imbalance, order_flow))
+
+        order_book_prediction = "Neutral 📊"
+        order_flow_prediction = "Neutral 📊"
+        signal = "⚡ No Strong Signal"
+
+        if bid_ask_spread > mean_spread * 1.5 and bid_ask_imbalance > mean_imbalance * 1.5:
+            order_book_prediction = "Bullish Breakout 🚀"
+            order_flow_prediction = "Bullish 📈"
+            signal = "✅ Buy Signal"
+        elif bid_ask_spread < mean_spread * 0.5 and bid_ask_imbalance < mean_imbalance * 0.5:
+            order_book_prediction = "Bearish Breakdown 📉"
+            order_flow_prediction = "Bearish 📉"
+            signal = "❌ Sell Signal"
+
+        return {
+            "symbol": symbol,
+            "bid_price": bid_price,
+            "ask_price": ask_price,
+            "bid_size": bid_size,
+            "ask_size": ask_size,
+            "tot_buy_qty": tot_buy_qty,
+            "tot_sell_qty": tot_sell_qty,
+            "order_book_prediction": order_book_prediction,
+            "order_flow_prediction": order_flow_prediction,
+            "signal": signal,
+            "processing_time_ms": (time.perf_counter() - start_time) * 1000,
+        }
+
+
+class StreamStage:
+    """ZeroMQ stage that consumes raw ticks on 5555 and publishes processed ticks on 5556."""
+
+    def __init__(self, in_address="tcp://127.0.0.1:5555", out_address="tcp://127.0.0.1:5556", codec="json",
+                 window=MAX_DATA_POINTS, poll_timeout_ms=100):
+        self.in_address = in_address
+        self.out_address = out_address
+        self.codec = get_codec(codec)
+        self.processor = StreamProcessor(window)
+        self.poll_timeout_ms = poll_timeout_ms
+        self.processed = 0
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Run the stage on a daemon thread inside the current process."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout_ms / 1000 * 2)
+            self._thread = None
+
+    def run_forever(self):
+        """Run the stage on the calling thread (standalone mode)."""
+        self._running = True
+        self._run()
+
+    def _run(self):
+        context = zmq.Context.instance()
+        receiver = context.socket(zmq.SUB)
+        receiver.setsockopt(zmq.LINGER, 0)
+        receiver.connect(self.in_address)
+        receiver.setsockopt_string(zmq.SUBSCRIBE, "")
+        sender = context.socket(zmq.PUB)
+        sender.setsockopt(zmq.LINGER, 0)
+        sender.bind(self.out_address)
+
+        poller = zmq.Poller()
+        poller.register(receiver, zmq.POLLIN)
+
+        try:
+            while self._running:
+                # Sleep in the poller until data arrives instead of spinning on a non-blocking recv
+                if not poller.poll(self.poll_timeout_ms):
+                    continue
+                while True:
+                    try:
+                        frames = receiver.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    self._handle(sender, frames[-1])
+        finally:
+            receiver.close()
+            sender.close()
+
+    def _handle(self, sender, frame):
+        try:
+            market_data = decode_message(frame)
+            stamp(market_data, "proc_in")
+            processed_data = self.processor.process(market_data)
+        except Exception as e:
+            print(f"❌ Error processing data: {e}")
+            return
+        # Carry the upstream trace through so the GUI can measure the whole chain
+        if "trace" in market_data:
+            processed_data["trace"] = market_data["trace"]
+            stamp(processed_data, "proc_out")
+        topic = processed_data["symbol"].encode()
+        sender.send_multipart([topic, self.codec.encode(processed_data)], zmq.NOBLOCK)
+        self.processed += 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Python stream processor (5555 -> 5556). Run as: python -m FyersData.StreamProcessor")
+    parser.add_argument("--in-address", default="tcp://127.0.0.1:5555")
+    parser.add_argument("--out-address", default="tcp://127.0.0.1:5556")
+    parser.add_argument("--codec", default="json", choices=["json", "struct", "msgpack"])
+    parser.add_argument("--window", type=int, default=MAX_DATA_POINTS)
+    args = parser.parse_args()
+
+    print("✅ Python Stream Processor Started. Waiting for incoming live data...")
+    StreamStage(args.in_address, args.out_address, args.codec, args.window).run_forever()
@@ -0,0 +1,152 @@
+import threading
+
+# Fyers allows 5000 symbols per data socket; subscribe in batches so one call never carries too many
+MAX_SYMBOLS = 5000
+BATCH_SIZE = 500
+
+# Delay before retrying a connection that did not open (e.g. a rejected token), doubling up to the maximum
+RETRY_SECONDS = 1.0
+MAX_RETRY_SECONDS = 60.0
+
+
+class SubscriptionManager:
+    """Keeps the single Fyers data socket subscribed to a desired symbol set without reconnecting.
+
+    Each consumer (owner) sets its own symbols; the desired set is their union in first-seen order.
+    set_symbols() only records it. A worker thread connects the socket once, then diffs
+    desired against active symbols and sends batched unsubscribe/subscribe calls. The SDK sleeps inside
+    subscribe(), so none of this runs on the UI thread.
+    """
+
+    def __init__(self, socket, data_type="SymbolUpdate", batch_size=BATCH_SIZE, max_symbols=MAX_SYMBOLS):
+        self.socket = socket  # fyers_apiv3 FyersDataSocket, or None while there is no access token
+        self.data_type = data_type
+        self.batch_size = batch_size
+        self.max_symbols = max_symbols
+        self.lock = threading.Lock()
+        self.changed = threading.Event()
+        self.owners = {}  # Owner name -> its ordered, de-duplicated symbols
+        self.desired = []  # Union over owners, ordered and capped at max_symbols
+        self.active = set()
+        self.connecting = False
+        self.retry_delay = RETRY_SECONDS
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="fyers-subscriptions", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=2):
+        """Stop the worker; timeout=None waits for a connect() or subscribe() in flight to return."""
+        self.running = False
+        self.changed.set()
+        if self.thread is not None:
+            self.thread.join(timeout=timeout)
+            self.thread = None
+
+    def set_symbols(self, symbols, owner="default"):
+        """Replace `owner`'s symbols (an empty list drops them); returns its symbols after de-duplication."""
+        wanted = list(dict.fromkeys(symbol.strip() for symbol in symbols if symbol.strip()))
+        with self.lock:
+            if wanted:
+                self.owners[owner] = wanted
+            else:
+                self.owners.pop(owner, None)
+            desired = list(dict.fromkeys(symbol for symbols in self.owners.values() for symbol in symbols))
+            if len(desired) > self.max_symbols:
+                print(f"⚠️ {len(desired)} symbols requested, keeping the first {self.max_symbols}")
+                desired = desired[:self.max_symbols]
+            self.desired = desired
+        self.start()
+        self.changed.set()
+        return wanted
+
+    def symbols(self):
+        with self.lock:
+            return list(self.desired)
+
+    def owned(self):
+        """Copy of every owner's symbols, e.g. to carry them over to a manager for a new socket."""
+        with self.lock:
+            return {owner: list(symbols) for owner, symbols in self.owners.items()}
+
+    def on_connected(self):
+        """Call from the socket's on_connect: a fresh connection has no subscriptions yet."""
+        with self.lock:
+            self.active = set()
+        # The SDK's connect() calls on_connect even when the socket never opened; sync() retries that case
+        if self.socket.is_connected():
+            self.retry_delay = RETRY_SECONDS
+            self.changed.set()
+
+    def run(self):
+        while self.running:
+            self.changed.wait()
+            self.changed.clear()
+            if not self.running:
+                return
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"❌ Subscription update failed: {e}")
+
+    def sync(self):
+        if self.socket is None:
+            return  # Symbols are only recorded until the feed has a token and a socket
+        if not self.socket.is_connected():
+            if not self.connecting:
+                self.connecting = True
+                try:
+                    self.socket.connect()  # on_connect -> on_connected() triggers the first sync
+                except Exception as e:
+                    print(f"❌ Fyers data socket connect failed: {e}")
+                finally:
+                    self.connecting = False
+            if not self.socket.is_connected():
+                self.retry_later()
+            return
+
+        with self.lock:
+            desired = list(self.desired)
+            active = set(self.active)
+        wanted = set(desired)
+        removed = [symbol for symbol in active if symbol not in wanted]
+        added = [symbol for symbol in desired if symbol not in active]
+
+        for batch in self.batches(removed):
+            self.restore_channel_tokens(active)
+            self.socket.unsubscribe(symbols=batch, data_type=self.data_type)
+            active.difference_update(batch)
+        for batch in self.batches(added):
+            self.socket.subscribe(symbols=batch, data_type=self.data_type)
+            active.update(batch)
+        if removed or added:
+            print(f"🔄 Subscriptions: +{len(added)} -{len(removed)} ({len(active)} active)")
+
+        with self.lock:
+            self.active = active
+
+    def retry_later(self):
+        # A connection that fails to open only reaches the SDK's on_error, so nothing else would trigger another
+        # attempt; wait (waking early on stop or a watchlist change) and try again with a growing delay
+        delay = self.retry_delay
+        self.retry_delay = min(delay * 2, MAX_RETRY_SECONDS)
+        self.changed.wait(delay)
+        self.changed.set()
+
+    def batches(self, symbols):
+        return [symbols[i:i + self.batch_size] for i in range(0, len(symbols), self.batch_size)]
+
+    def restore_channel_tokens(self, active):
+        # The SDK only remembers the tokens of the most recent subscribe() batch per channel and silently skips
+        # unsubscribing anything else, so point it back at every token that is currently subscribed
+        channel = getattr(self.socket, "channel_num", None)
+        tokens = getattr(self.socket, "symbol_token", None)
+        scrips = getattr(self.socket, "scrips_count", None)
+        if channel is None or tokens is None or scrips is None:
+            return
+        scrips[channel] = [token for token, symbol in tokens.items() if symbol in active]
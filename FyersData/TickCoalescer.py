@@ -0,0 +1,31 @@
+import threading
+
+
+class TickCoalescer:
+    """Keeps only the latest tick per symbol between frames so the UI applies one update per symbol per frame."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest = {}
+        self.received = 0  # Ticks pushed since start
+        self.coalesced = 0  # Ticks overwritten by a newer tick for the same symbol before a frame consumed them
+
+    def push(self, data):
+        """Store a tick from the receiver thread, replacing any pending tick for the same symbol."""
+        symbol = data.get("symbol", "N/A")
+        with self._lock:
+            if symbol in self._latest:
+                self.coalesced += 1
+            self._latest[symbol] = data
+            self.received += 1
+
+    def drain(self):
+        """Return the pending ticks (one per symbol) and reset. Called once per frame from the main thread."""
+        with self._lock:
+            latest, self._latest = self._latest, {}
+        return list(latest.values())
+
+    def pending(self):
+        """Number of symbols waiting for the next frame."""
+        with self._lock:
+            return len(self._latest)
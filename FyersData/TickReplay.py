@@ -0,0 +1,121 @@
+import argparse
+import atexit
+import json
+import struct
+import time
+from FyersData.MarketPublisher import MarketPublisher
+from Utils.LatencyTracer import stamp
+
+# File layout: MAGIC, then records of <receive time ns (int64), payload length (uint32)> + compact JSON payload.
+# Receive times are wall-clock epoch ns. A zero-length record marks the start of each recording session, so
+# sessions appended to the same file replay back to back instead of waiting out the gap between them.
+MAGIC = b"FYTICK2\n"
+RECORD_HEADER = struct.Struct("<qI")
+
+
+class TickRecorder:
+    """Appends raw Fyers onmessage payloads with their receive time to a compact append-only file.
+
+    The file is flushed every `flush_every` records and closed at interpreter exit, so the tail is not lost.
+    """
+
+    def __init__(self, path, flush_every=1000):
+        self.path = path
+        self.flush_every = flush_every
+        self.recorded = 0
+        self.file = open(path, "a+b")
+        self.file.seek(0)
+        magic = self.file.read(len(MAGIC))
+        if magic and magic != MAGIC:
+            self.file.close()
+            raise ValueError(f"{path} is a recording in another format; record to a new file")
+        if not magic:
+            self.file.write(MAGIC)
+        self.file.write(RECORD_HEADER.pack(time.time_ns(), 0))  # Session marker
+        atexit.register(self.close)
+
+    def record(self, message):
+        """Append one message. The latency trace, if any, is not recorded."""
+        payload = {key: value for key, value in message.items() if key != "trace"}
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        self.file.write(RECORD_HEADER.pack(time.time_ns(), len(data)) + data)
+        self.recorded += 1
+        if self.recorded % self.flush_every == 0:
+            self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+        atexit.unregister(self.close)
+
+
+def read_ticks(path):
+    """Yield (receive time ns, message) pairs from a recording; message is None at the start of each session."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a tick recording")
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return  # End of file (or a record cut short by a crash while recording)
+            timestamp_ns, length = RECORD_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                return
+            yield timestamp_ns, json.loads(data) if length else None
+
+
+class TickReplayer:
+    """Republishes a recording on the market-data bus at original cadence, N× speed or max rate."""
+
+    def __init__(self, path, address="tcp://127.0.0.1:5555", speed=1.0, codec="json"):
+        self.path = path
+        self.speed = speed  # 0 replays as fast as possible
+        self.publisher = MarketPublisher(address, codec=codec)
+        self.published = 0
+
+    def run(self, loops=1, warmup=0.5):
+        """Replay the file `loops` times and return the achieved messages per second."""
+        time.sleep(warmup)  # Give subscribers time to connect before the first tick (ZMQ slow joiner)
+        start = time.perf_counter()
+        for _ in range(loops):
+            self._replay_once()
+        elapsed = time.perf_counter() - start
+        return self.published / elapsed if elapsed > 0 else 0.0
+
+    def _replay_once(self):
+        first_ns = start_ns = None
+        for timestamp_ns, message in read_ticks(self.path):
+            if message is None:
+                first_ns = None  # New session: restart the cadence from here
+                continue
+            if self.speed > 0:
+                if first_ns is None:
+                    first_ns = timestamp_ns
+                    start_ns = time.perf_counter_ns()
+                due_ns = start_ns + (timestamp_ns - first_ns) / self.speed
+                delay = (due_ns - time.perf_counter_ns()) / 1e9
+                if delay > 0:
+                    time.sleep(delay)
+            stamp(message, "fyers_recv")
+            self.publisher.publish(message)
+            self.published += 1
+
+    def close(self):
+        self.publisher.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded Fyers ticks. Run as: python -m FyersData.TickReplay")
+    parser.add_argument("path", help="Recording written by TickRecorder")
+    parser.add_argument("--address", default="tcp://127.0.0.1:5555")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed multiplier, 0 for max rate")
+    parser.add_argument("--loops", type=int, default=1)
+    parser.add_argument("--codec", default="json", choices=["json", "struct", "msgpack"])
+    args = parser.parse_args()
+
+    replayer = TickReplayer(args.path, args.address, args.speed, args.codec)
+    print(f"▶️ Replaying {args.path} at {'max rate' if args.speed == 0 else f'{args.speed}x'}...")
+    rate = replayer.run(loops=args.loops)
+    print(f"✅ Published {replayer.published} ticks ({rate:.0f} msgs/s)")
+    replayer.close()
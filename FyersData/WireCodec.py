@@ -0,0 +1,168 @@
+import json
+import struct
+from Utils.LatencyTracer import TRACE_STAGES
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; the JSON and struct codecs need nothing extra
+    msgpack = None
+
+# Numeric tick fields carried by the fixed-layout struct codec, in wire order: prices as float64, counts and
+# epoch times as int64, so both decode with the type Fyers sent
+FLOAT_FIELDS = (
+    "ltp", "bid_price", "ask_price", "avg_trade_price", "low_price", "high_price",
+    "open_price", "prev_close_price", "processing_time_ms",
+)
+INTEGER_FIELDS = (
+    "vol_traded_today", "last_traded_time", "exch_feed_time", "bid_size", "ask_size",
+    "last_traded_qty", "tot_buy_qty", "tot_sell_qty",
+)
+NUMERIC_FIELDS = FLOAT_FIELDS + INTEGER_FIELDS
+
+# Short text fields appended after the numeric block as length-prefixed UTF-8
+TEXT_FIELDS = ("type", "order_book_prediction", "order_flow_prediction", "signal")
+
+# Bitmask flags for the optional blocks that close a struct frame: latency trace stamps, then a JSON object
+# with every field the fixed layout cannot carry exactly (unknown keys, None, values of another type or out of
+# range, symbols over SYMBOL_BYTES and text over TEXT_BYTES)
+TRACE_BIT = 1 << (len(NUMERIC_FIELDS) + len(TEXT_FIELDS))
+EXTRA_BIT = TRACE_BIT << 1
+
+SYMBOL_BYTES = 32
+TEXT_BYTES = 255
+
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+class JsonCodec:
+    """Plain JSON frames. The fallback every peer understands, including StreamProcessing.exe."""
+
+    name = "json"
+    tag = b"{"  # JSON objects always start with '{', so no extra tag byte is needed
+
+    def encode(self, message):
+        return json.dumps(message, separators=(",", ":")).encode()
+
+    def decode(self, frame):
+        return json.loads(frame)
+
+
+class StructCodec:
+    """Fixed-layout binary frames: tag, field bitmask, symbol, float64 and int64 blocks, short text fields,
+    trace stamps and a JSON block for anything else, so every message round-trips unchanged."""
+
+    name = "struct"
+    tag = b"\x01"
+
+    _header = struct.Struct(f"<cI{SYMBOL_BYTES}s")
+    _numbers = struct.Struct(f"<{len(FLOAT_FIELDS)}d{len(INTEGER_FIELDS)}q")
+    _trace = struct.Struct(f"<{len(TRACE_STAGES)}q")
+    _extra_length = struct.Struct("<I")
+    _known = frozenset(("symbol", "trace", *NUMERIC_FIELDS, *TEXT_FIELDS))
+
+    def encode(self, message):
+        mask = 0
+        numbers = []
+        extra = {}
+        for bit, field in enumerate(NUMERIC_FIELDS):
+            value = message.get(field)
+            kind = float if field in FLOAT_FIELDS else int
+            if type(value) is kind and (kind is float or INT64_MIN <= value <= INT64_MAX):
+                mask |= 1 << bit
+                numbers.append(value)
+            else:
+                numbers.append(kind(0))
+                if field in message:
+                    extra[field] = value  # e.g. None or an integer price, kept as sent
+
+        tail = []
+        for bit, field in enumerate(TEXT_FIELDS, start=len(NUMERIC_FIELDS)):
+            if field not in message:
+                continue
+            value = message[field]
+            encoded = value.encode() if isinstance(value, str) else None
+            if encoded is not None and len(encoded) <= TEXT_BYTES:
+                mask |= 1 << bit
+                tail.append(bytes((len(encoded),)) + encoded)
+            else:
+                extra[field] = value
+
+        trace = message.get("trace")
+        if trace is not None:
+            mask |= TRACE_BIT
+            tail.append(self._trace.pack(*(trace.get(stage, 0) for stage in TRACE_STAGES)))
+
+        symbol = message.get("symbol", "")
+        if not isinstance(symbol, str) or len(symbol.encode()) > SYMBOL_BYTES:
+            extra["symbol"] = symbol
+            symbol = ""
+        extra.update((key, value) for key, value in message.items() if key not in self._known)
+        if extra:
+            mask |= EXTRA_BIT
+            data = json.dumps(extra, separators=(",", ":")).encode()
+            tail.append(self._extra_length.pack(len(data)) + data)
+
+        header = self._header.pack(self.tag, mask, symbol.encode())
+        return b"".join([header, self._numbers.pack(*numbers), *tail])
+
+    def decode(self, frame):
+        _, mask, symbol = self._header.unpack_from(frame)
+        numbers = self._numbers.unpack_from(frame, self._header.size)
+        message = {"symbol": symbol.rstrip(b"\x00").decode()}
+        for bit, field in enumerate(NUMERIC_FIELDS):
+            if mask & (1 << bit):
+                message[field] = numbers[bit]
+
+        offset = self._header.size + self._numbers.size
+        for bit, field in enumerate(TEXT_FIELDS, start=len(NUMERIC_FIELDS)):
+            if mask & (1 << bit):
+                length = frame[offset]
+                message[field] = bytes(frame[offset + 1:offset + 1 + length]).decode()
+                offset += 1 + length
+
+        if mask & TRACE_BIT:
+            stamps = self._trace.unpack_from(frame, offset)
+            message["trace"] = {stage: value for stage, value in zip(TRACE_STAGES, stamps) if value}
+            offset += self._trace.size
+
+        if mask & EXTRA_BIT:
+            (length,) = self._extra_length.unpack_from(frame, offset)
+            offset += self._extra_length.size
+            message.update(json.loads(bytes(frame[offset:offset + length])))
+        return message
+
+
+class MsgpackCodec:
+    """MessagePack frames, keeping every field of the message. Requires the optional msgpack package."""
+
+    name = "msgpack"
+    tag = b"\x02"
+
+    def encode(self, message):
+        return self.tag + msgpack.packb(message, use_bin_type=True)
+
+    def decode(self, frame):
+        return msgpack.unpackb(frame[1:], raw=False)
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec(), StructCodec(), MsgpackCodec())}
+_CODECS_BY_TAG = {codec.tag[0]: codec for codec in CODECS.values()}
+
+
+def get_codec(name):
+    """Return the codec registered under `name`, falling back to JSON when it is unavailable."""
+    if name == "msgpack" and msgpack is None:
+        print("⚠️ msgpack is not installed, falling back to JSON wire format")
+        name = "json"
+    if name not in CODECS:
+        raise ValueError(f"Unknown wire codec: {name}")
+    return CODECS[name]
+
+
+def decode_message(frame):
+    """Decode a frame from any codec. The first byte identifies the codec the publisher chose for its socket."""
+    codec = _CODECS_BY_TAG.get(frame[0])
+    if codec is None:
+        raise ValueError(f"Unknown wire codec tag: {frame[:1]!r}")
+    return codec.decode(frame)
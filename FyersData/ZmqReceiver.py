@@ -0,0 +1,128 @@
+import threading
+import zmq
+from FyersData.WireCodec import decode_message
+
+
+class ZmqBatchReceiver:
+    """Drains a ZeroMQ SUB socket in non-blocking batches on a background thread."""
+
+    def __init__(self, address, on_message, max_batch=500, high_water_mark=10000, poll_timeout_ms=100,
+                 decode=decode_message, topics=None):
+        self.address = address
+        self.on_message = on_message  # Called from the receiver thread with each decoded message
+        self.max_batch = max_batch  # Upper bound on messages drained per wake-up
+        self.high_water_mark = high_water_mark  # ZMQ RCVHWM; messages beyond it are dropped by ZMQ
+        self.poll_timeout_ms = poll_timeout_ms
+        self.decode = decode  # Detects JSON, struct or msgpack frames from their first byte
+
+        # Symbols to subscribe to; None subscribes to every topic. Changes are applied by the receiver thread
+        self._topics_lock = threading.Lock()
+        self._requested_topics = None if topics is None else set(topics)
+        self._topics_changed = True
+        self._topics = set()  # Active subscriptions on the socket
+        self._topic_bytes = None  # Exact topics to keep, None when everything is wanted
+
+        self.received = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.decode_errors = 0
+        self.filtered = 0
+
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Start the receiver thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the receiver thread to exit after its current poll."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout_ms / 1000 * 2)
+            self._thread = None
+
+    def set_topics(self, topics):
+        """Replace the subscribed symbols (None for all). Safe to call from any thread."""
+        with self._topics_lock:
+            self._requested_topics = None if topics is None else set(topics)
+            self._topics_changed = True
+
+    def _apply_topics(self, socket):
+        """Diff requested against active subscriptions on the socket. Runs on the receiver thread only."""
+        with self._topics_lock:
+            requested = self._requested_topics
+            self._topics_changed = False
+
+        active = {""} if self._topics is None else self._topics
+        wanted = {""} if requested is None else requested
+        for topic in active - wanted:
+            socket.setsockopt_string(zmq.UNSUBSCRIBE, topic)
+        for topic in wanted - active:
+            socket.setsockopt_string(zmq.SUBSCRIBE, topic)
+        self._topics = requested
+        self._topic_bytes = None if requested is None else {topic.encode() for topic in requested}
+
+    def _run(self):
+        socket = zmq.Context.instance().socket(zmq.SUB)
+        socket.setsockopt(zmq.RCVHWM, self.high_water_mark)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect(self.address)
+        self._topics = set()  # A fresh socket starts with no subscriptions
+        self._topics_changed = True
+
+        poller = zmq.Poller()
+        poller.register(socket, zmq.POLLIN)
+
+        try:
+            while self._running:
+                if self._topics_changed:
+                    self._apply_topics(socket)
+
+                # Block in the poller instead of sleeping, then drain everything that is pending
+                if not poller.poll(self.poll_timeout_ms):
+                    continue
+                self._drain(socket)
+        finally:
+            socket.close()
+
+    def _drain(self, socket):
+        """Receive up to max_batch pending messages without blocking."""
+        batch = []
+        while len(batch) < self.max_batch:
+            try:
+                frames = socket.recv_multipart(zmq.NOBLOCK)
+            except zmq.Again:
+                break
+            # ZMQ matches topics by prefix, so drop e.g. "NSE:SBIN-EQ2" when only "NSE:SBIN-EQ" is wanted
+            if self._topic_bytes is not None and len(frames) > 1 and frames[0] not in self._topic_bytes:
+                self.filtered += 1
+                continue
+            batch.append(frames[-1])
+
+        self.batches += 1
+        self.received += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        for message in batch:
+            try:
+                data = self.decode(message)
+            except Exception as e:
+                self.decode_errors += 1
+                print("Error receiving data:", e)
+                continue
+            self.on_message(data)
+
+    def stats(self):
+        """Counters describing receiver throughput."""
+        return {
+            "received": self.received,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "decode_errors": self.decode_errors,
+            "filtered": self.filtered,
+        }
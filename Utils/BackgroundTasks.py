@@ -0,0 +1,75 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task when its CancelToken has been cancelled."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared between the UI and a running task."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def check(self):
+        """Raise TaskCancelled if cancellation was requested. Call between units of work."""
+        if self.cancelled:
+            raise TaskCancelled()
+
+
+class BackgroundTasks:
+    """Runs blocking work on a thread pool and hands progress and results back to the UI thread.
+
+    Tasks never touch DearPyGui themselves; their callbacks are queued and run by poll(), which the
+    render loop calls once per frame on the main thread.
+    """
+
+    def __init__(self, max_workers=4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="background-task")
+        self._events = queue.SimpleQueue()
+
+    def submit(self, fn, *args, on_done=None, on_error=None, on_progress=None, on_cancel=None):
+        """Run fn(cancel_token, progress, *args) in the pool and return its CancelToken.
+
+        `progress(message)` may be called from the task; on_progress receives it on the UI thread.
+        """
+        token = CancelToken()
+
+        def progress(message):
+            if on_progress is not None and not token.cancelled:
+                self._events.put((on_progress, message))
+
+        def run():
+            # Exactly one of on_done, on_error or on_cancel is queued for every task
+            try:
+                result = fn(token, progress, *args)
+                error = None
+            except TaskCancelled:
+                result = error = None
+            except Exception as e:
+                result, error = None, e
+            # A task cancelled while blocked in I/O still finishes; its result or error is discarded here
+            if token.cancelled:
+                if on_cancel is not None:
+                    self._events.put((on_cancel, None))
+            elif error is not None:
+                if on_error is not None:
+                    self._events.put((on_error, error))
+            elif on_done is not None:
+                self._events.put((on_done, result))
+
+        self.executor.submit(run)
+        return token
+
+    def poll(self):
+        """Run queued callbacks on the calling (UI) thread."""
+        while True:
+            try:
+                callback, value = self._events.get_nowait()
+            except queue.Empty:
+                return
+            callback(value)
@@ -0,0 +1,334 @@
+import math
+from collections import deque
+import numpy as np
+
+# Exchange session offset from UTC (IST) used to reset VWAP at each trading day
+SESSION_UTC_OFFSET = 19800
+
+
+def ewm(values, alpha, initial):
+    """Exponential recursion y[t] = (1 - alpha) * y[t-1] + alpha * x[t], starting from y[-1] = `initial`.
+
+    Evaluated in closed form per block with cumsum; blocks are sized so the rescaling factor stays
+    below 1e6, which keeps the result within float64 rounding of the plain loop.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.empty_like(values)
+    decay = 1.0 - alpha
+    if decay <= 0:
+        out[:] = values
+        return out
+    block = max(int(math.log(1e6) / -math.log(decay)), 1)
+    previous = initial
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(1, len(chunk) + 1)
+        out[start:start + len(chunk)] = powers * (previous + alpha * np.cumsum(chunk / powers))
+        previous = out[start + len(chunk) - 1]
+    return out
+
+
+def sma(values, period):
+    """Simple moving average; the first period - 1 entries are NaN."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        sums = np.cumsum(np.insert(values, 0, 0.0))
+        out[period - 1:] = (sums[period:] - sums[:-period]) / period
+    return out
+
+
+def ema(values, period):
+    """Exponential moving average (alpha = 2 / (period + 1)) seeded with the SMA of the first `period` values."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        seed = values[:period].mean()
+        out[period - 1] = seed
+        out[period:] = ewm(values[period:], 2.0 / (period + 1), seed)
+    return out
+
+
+def rma(values, period):
+    """Wilder's smoothing (alpha = 1 / period) seeded with the SMA of the first `period` values."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        seed = values[:period].mean()
+        out[period - 1] = seed
+        out[period:] = ewm(values[period:], 1.0 / period, seed)
+    return out
+
+
+def rsi(closes, period=14):
+    """Wilder's Relative Strength Index, 0-100; the first `period` entries are NaN."""
+    closes = np.asarray(closes, dtype=np.float64)
+    out = np.full(len(closes), np.nan)
+    if len(closes) <= period:
+        return out
+    change = np.diff(closes)
+    avg_gain = rma(np.maximum(change, 0.0), period)
+    avg_loss = rma(np.maximum(-change, 0.0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[1:] = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return out
+
+
+def macd(closes, fast=12, slow=26, signal=9):
+    """MACD line, signal line and histogram."""
+    line = ema(closes, fast) - ema(closes, slow)
+    signal_line = np.full(len(line), np.nan)
+    valid = np.flatnonzero(~np.isnan(line))
+    if len(valid):
+        signal_line[valid[0]:] = ema(line[valid[0]:], signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger(closes, period=20, num_std=2.0):
+    """Middle (SMA), upper and lower Bollinger bands using the population standard deviation."""
+    closes = np.asarray(closes, dtype=np.float64)
+    middle = sma(closes, period)
+    # Rolling variance from cumulative sums of values centred on their mean, to limit cancellation
+    centred = closes - (closes.mean() if len(closes) else 0.0)
+    mean_square = sma(centred * centred, period)
+    mean = middle - (closes.mean() if len(closes) else 0.0)
+    std = np.sqrt(np.maximum(mean_square - mean * mean, 0.0))
+    return middle, middle + num_std * std, middle - num_std * std
+
+
+def vwap(highs, lows, closes, volumes, timestamps=None):
+    """Volume-weighted average price of the typical price, restarting each session when timestamps are given."""
+    typical = (np.asarray(highs, dtype=np.float64) + np.asarray(lows, dtype=np.float64)
+               + np.asarray(closes, dtype=np.float64)) / 3.0
+    volumes = np.asarray(volumes, dtype=np.float64)
+    price_volume = np.cumsum(typical * volumes)
+    total_volume = np.cumsum(volumes)
+    if timestamps is not None and len(volumes):
+        # Subtract the running totals at each session's first bar
+        day = (np.asarray(timestamps, dtype=np.int64) + SESSION_UTC_OFFSET) // 86400
+        starts = np.flatnonzero(np.diff(day, prepend=day[0] - 1))
+        session = np.cumsum(np.diff(day, prepend=day[0]) != 0)
+        price_volume = price_volume - (price_volume[starts] - typical[starts] * volumes[starts])[session]
+        total_volume = total_volume - (total_volume[starts] - volumes[starts])[session]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total_volume > 0, price_volume / total_volume, np.nan)
+
+
+def true_range(highs, lows, closes):
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    closes = np.asarray(closes, dtype=np.float64)
+    previous = np.concatenate(([np.nan], closes[:-1]))
+    ranges = np.fmax(highs - lows, np.fmax(np.abs(highs - previous), np.abs(lows - previous)))
+    return ranges
+
+
+def atr(highs, lows, closes, period=14):
+    """Wilder's Average True Range; the first period - 1 entries are NaN."""
+    return rma(true_range(highs, lows, closes), period)
+
+
+class RollingSMA:
+    """O(1) simple moving average over the last `period` values."""
+
+    def __init__(self, period):
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+
+    def seed(self, values):
+        """Start from the tail of an existing series without replaying it."""
+        self.window = deque(np.asarray(values, dtype=np.float64)[-self.period:].tolist(), maxlen=self.period)
+        self.total = math.fsum(self.window)
+        return self
+
+    def update(self, value):
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(value)
+        self.total += value
+        return self.value
+
+    def replace(self, value):
+        """Correct the most recent update(), e.g. when the forming bar's close moves."""
+        if not self.window:
+            return self.update(value)
+        self.total += value - self.window[-1]
+        self.window[-1] = value
+        return self.value
+
+    @property
+    def value(self):
+        return self.total / self.period if len(self.window) == self.period else math.nan
+
+
+class RollingEMA:
+    """O(1) exponential moving average with the same SMA seeding as ema()."""
+
+    def __init__(self, period, alpha=None):
+        self.period = period
+        self.alpha = alpha or 2.0 / (period + 1)
+        self.count = 0
+        self.value = math.nan
+        self.warmup = 0.0
+        self.previous = None  # State before the last update(), restored by replace()
+
+    def seed(self, values, last_value):
+        """Continue from `last_value`, the final entry of the vectorized series over `values`."""
+        self.count = len(values)
+        if self.count < self.period:
+            self.warmup = float(np.sum(values))
+            self.value = math.nan
+        else:
+            self.value = float(last_value)
+        return self
+
+    def update(self, value):
+        self.previous = (self.count, self.value, self.warmup)
+        self.count += 1
+        if self.count < self.period:
+            self.warmup += value
+        elif self.count == self.period:
+            self.value = (self.warmup + value) / self.period
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def replace(self, value):
+        """Correct the most recent update(), e.g. when the forming bar's close moves."""
+        if self.previous is not None:
+            self.count, self.value, self.warmup = self.previous
+        return self.update(value)
+
+
+class RollingRSI:
+    """O(1) Wilder RSI."""
+
+    def __init__(self, period=14):
+        self.period = period
+        self.gain = RollingEMA(period, alpha=1.0 / period)
+        self.loss = RollingEMA(period, alpha=1.0 / period)
+        self.previous = None
+
+    def seed(self, closes):
+        closes = np.asarray(closes, dtype=np.float64)
+        if len(closes) > 1:
+            change = np.diff(closes)
+            gains, losses = np.maximum(change, 0.0), np.maximum(-change, 0.0)
+            self.gain.seed(gains, rma(gains, self.period)[-1])
+            self.loss.seed(losses, rma(losses, self.period)[-1])
+        if len(closes):
+            self.previous = float(closes[-1])
+        return self
+
+    def update(self, close):
+        if self.previous is not None:
+            change = close - self.previous
+            self.gain.update(max(change, 0.0))
+            self.loss.update(max(-change, 0.0))
+        self.previous = close
+        return self.value
+
+    @property
+    def value(self):
+        if math.isnan(self.gain.value):
+            return math.nan
+        if self.loss.value == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self.gain.value / self.loss.value)
+
+
+class RollingMACD:
+    """O(1) MACD line, signal and histogram."""
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast = RollingEMA(fast)
+        self.slow = RollingEMA(slow)
+        self.signal = RollingEMA(signal)
+
+    def seed(self, closes):
+        closes = np.asarray(closes, dtype=np.float64)
+        line, signal_line, _ = macd(closes, self.fast.period, self.slow.period, self.signal.period)
+        if len(closes):
+            self.fast.seed(closes, ema(closes, self.fast.period)[-1])
+            self.slow.seed(closes, ema(closes, self.slow.period)[-1])
+            self.signal.seed(line[~np.isnan(line)], signal_line[-1])
+        return self
+
+    def update(self, close):
+        line = self.fast.update(close) - self.slow.update(close)
+        if not math.isnan(line):
+            self.signal.update(line)
+        return line, self.signal.value, line - self.signal.value
+
+
+class RollingBollinger:
+    """O(1) Bollinger bands from running sums over the last `period` closes."""
+
+    def __init__(self, period=20, num_std=2.0):
+        self.num_std = num_std
+        self.mean = RollingSMA(period)
+        self.square = RollingSMA(period)
+
+    def seed(self, closes):
+        closes = np.asarray(closes, dtype=np.float64)
+        self.mean.seed(closes)
+        self.square.seed(closes * closes)
+        return self
+
+    def update(self, close):
+        return self.bands(self.mean.update(close), self.square.update(close * close))
+
+    def replace(self, close):
+        """Correct the most recent update(), e.g. when the forming bar's close moves."""
+        return self.bands(self.mean.replace(close), self.square.replace(close * close))
+
+    def bands(self, middle, mean_square):
+        std = math.sqrt(max(mean_square - middle * middle, 0.0))
+        return middle, middle + self.num_std * std, middle - self.num_std * std
+
+
+class RollingVWAP:
+    """O(1) session VWAP."""
+
+    def __init__(self):
+        self.price_volume = 0.0
+        self.volume = 0.0
+        self.session = None
+
+    def update(self, high, low, close, volume, timestamp=None):
+        if timestamp is not None:
+            session = (int(timestamp) + SESSION_UTC_OFFSET) // 86400
+            if session != self.session:
+                self.price_volume = self.volume = 0.0
+                self.session = session
+        self.price_volume += (high + low + close) / 3.0 * volume
+        self.volume += volume
+        return self.value
+
+    @property
+    def value(self):
+        return self.price_volume / self.volume if self.volume > 0 else math.nan
+
+
+class RollingATR:
+    """O(1) Wilder ATR."""
+
+    def __init__(self, period=14):
+        self.average = RollingEMA(period, alpha=1.0 / period)
+        self.previous = None
+
+    def seed(self, highs, lows, closes):
+        ranges = true_range(highs, lows, closes)
+        if len(ranges):
+            self.average.seed(ranges, rma(ranges, self.average.period)[-1])
+            self.previous = float(np.asarray(closes)[-1])
+        return self
+
+    def update(self, high, low, close):
+        if self.previous is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self.previous), abs(low - self.previous))
+        self.previous = close
+        return self.average.update(tr)
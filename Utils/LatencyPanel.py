@@ -0,0 +1,49 @@
+import time
+import dearpygui.dearpygui as dpg
+from Utils.LatencyTracer import SEGMENTS, tracer
+
+
+class LatencyPanel:
+    """Diagnostics panel showing p50/p95/p99 latency per pipeline segment."""
+
+    def __init__(self, refresh_interval=0.5):
+        self.refresh_interval = refresh_interval
+        self.last_refresh = 0.0
+        self.cells = []
+
+    def build(self):
+        """Create the panel inside the current DearPyGui container."""
+        with dpg.collapsing_header(label="Latency Diagnostics"):
+            with dpg.group(horizontal=True):
+                dpg.add_checkbox(label="Trace latency", default_value=tracer.enabled,
+                                 callback=lambda sender, app_data: tracer.set_enabled(app_data))
+                dpg.add_button(label="Dump Latency Report", callback=self.dump)
+                dpg.add_button(label="Reset", callback=tracer.reset)
+                dpg.add_text("", tag="latency_status")
+
+            with dpg.table(header_row=True, tag="latency_table", row_background=True, resizable=True):
+                dpg.add_table_column(label="Segment", width_stretch=True)
+                dpg.add_table_column(label="Samples", width_stretch=True)
+                dpg.add_table_column(label="p50 (ms)", width_stretch=True)
+                dpg.add_table_column(label="p95 (ms)", width_stretch=True)
+                dpg.add_table_column(label="p99 (ms)", width_stretch=True)
+                for label, _, _ in SEGMENTS:
+                    with dpg.table_row():
+                        dpg.add_text(label)
+                        self.cells.append([dpg.add_text("-") for _ in range(4)])
+
+    def refresh(self):
+        """Update the table at most once per refresh interval. Called from the render loop."""
+        now = time.monotonic()
+        if not self.cells or now - self.last_refresh < self.refresh_interval:
+            return
+        self.last_refresh = now
+        for cells, (_, count, p50, p95, p99) in zip(self.cells, tracer.summary()):
+            dpg.set_value(cells[0], str(count))
+            dpg.set_value(cells[1], f"{p50:.3f}")
+            dpg.set_value(cells[2], f"{p95:.3f}")
+            dpg.set_value(cells[3], f"{p99:.3f}")
+
+    def dump(self):
+        path = tracer.dump()
+        dpg.set_value("latency_status", f"Saved to {path}")
@@ -0,0 +1,127 @@
+import json
+import os
+import threading
+import time
+import numpy as np
+
+# Pipeline stages stamped on each tick, in order. Stamps are time.perf_counter_ns() values, which share
+# the system monotonic clock with std::chrono::steady_clock in StreamProcessing.cpp on the same host.
+TRACE_STAGES = ("fyers_recv", "publish", "proc_in", "proc_out", "gui_recv", "render")
+
+# Tracing is off by default: it adds a dict and six stamps to every tick. Enable it from the Latency Diagnostics
+# panel, or set this environment variable to 1 for processes without a GUI (publisher, processor, replay)
+TRACE_ENV = "TRACE_LATENCY"
+
+# Segments reported by the diagnostics panel: (label, from stage, to stage)
+SEGMENTS = (
+    ("Callback → Publish", "fyers_recv", "publish"),
+    ("Publish → Processor", "publish", "proc_in"),
+    ("Processor", "proc_in", "proc_out"),
+    ("Processor → GUI", "proc_out", "gui_recv"),
+    ("GUI → Frame", "gui_recv", "render"),
+    ("End to End", "fyers_recv", "render"),
+)
+
+
+def stamp(message, stage):
+    """Record the current monotonic time for `stage` in the message's trace, creating it if needed."""
+    if not tracer.enabled:
+        return
+    trace = message.get("trace")
+    if trace is None:
+        trace = message["trace"] = {}
+    trace[stage] = time.perf_counter_ns()
+
+
+class LatencyHistogram:
+    """Log-spaced latency histogram from 1 µs to ~100 s with percentile lookup."""
+
+    def __init__(self, buckets_per_decade=20, decades=8):
+        self.edges_ns = np.logspace(3, 3 + decades, buckets_per_decade * decades + 1)
+        self.counts = np.zeros(len(self.edges_ns) + 1, dtype=np.int64)
+        self.total = 0
+
+    def record(self, latency_ns):
+        self.counts[np.searchsorted(self.edges_ns, latency_ns)] += 1
+        self.total += 1
+
+    def percentile(self, q):
+        """Upper bucket edge (ms) below which `q` percent of samples fall."""
+        if self.total == 0:
+            return 0.0
+        bucket = int(np.searchsorted(np.cumsum(self.counts), self.total * q / 100))
+        edge = self.edges_ns[min(bucket, len(self.edges_ns) - 1)]
+        return float(edge) / 1e6
+
+
+class LatencyTracer:
+    """Collects per-segment latency histograms from traced ticks once they have been rendered.
+
+    frame_rendered() runs on the render loop while reset() and dump() come from DearPyGui callbacks, so the
+    histograms are only touched under a lock.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.histograms = {label: LatencyHistogram() for label, _, _ in SEGMENTS}
+        self._pending = []  # Traces applied to the UI this frame, completed by frame_rendered()
+
+    def set_enabled(self, enabled):
+        """Start or stop attaching traces to new ticks. Ticks already in flight finish their trace."""
+        self.enabled = bool(enabled)
+
+    def applied(self, message):
+        """Mark a tick as applied to the UI; its trace is closed when the frame is rendered."""
+        trace = message.get("trace")
+        if trace is not None:
+            self._pending.append(trace)
+
+    def frame_rendered(self):
+        """Stamp the render stage on every tick applied this frame and update the histograms."""
+        if not self._pending:
+            return
+        now = time.perf_counter_ns()
+        with self.lock:
+            for trace in self._pending:
+                trace["render"] = now
+                for label, start, end in SEGMENTS:
+                    if start in trace and end in trace:
+                        self.histograms[label].record(max(trace[end] - trace[start], 0))
+        self._pending.clear()
+
+    def summary(self):
+        """Rows of (segment, count, p50, p95, p99) with percentiles in milliseconds."""
+        with self.lock:
+            return [
+                (label, histogram.total, histogram.percentile(50), histogram.percentile(95),
+                 histogram.percentile(99))
+                for label, histogram in self.histograms.items()
+            ]
+
+    def dump(self, path="latency_report.json"):
+        """Write percentiles and raw bucket counts for every segment to `path`."""
+        with self.lock:
+            histograms = dict(self.histograms)
+        report = {
+            label: {
+                "count": histogram.total,
+                "p50_ms": histogram.percentile(50),
+                "p95_ms": histogram.percentile(95),
+                "p99_ms": histogram.percentile(99),
+                "bucket_edges_ns": histogram.edges_ns.tolist(),
+                "bucket_counts": histogram.counts.tolist(),
+            }
+            for label, histogram in histograms.items()
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        return path
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {label: LatencyHistogram() for label, _, _ in SEGMENTS}
+
+
+# Process-wide tracer shared by the publisher, processor and GUI
+tracer = LatencyTracer(enabled=os.environ.get(TRACE_ENV) == "1")
@@ -0,0 +1,65 @@
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+
+class RingBufferTable:
+    """Fixed pool of pre-created DearPyGui table rows backed by a NumPy ring buffer."""
+
+    def __init__(self, table_tag, num_columns, max_rows=20):
+        self.table_tag = table_tag
+        self.num_columns = num_columns
+        self.max_rows = max_rows
+
+        # Cell values live in a ring buffer; `shown` mirrors what the widgets currently display
+        self.values = np.full((max_rows, num_columns), "", dtype=object)
+        self.shown = np.full((max_rows, num_columns), "", dtype=object)
+        self.head = 0  # Next slot to overwrite
+        self.count = 0  # Number of filled slots
+        self.dirty = False
+
+        self.rows = []
+        self.cells = []
+        self.visible_rows = 0
+
+    def build(self):
+        """Create the row pool once. Call after the table columns have been added."""
+        for _ in range(self.max_rows):
+            with dpg.table_row(parent=self.table_tag, show=False) as row:
+                self.cells.append([dpg.add_text("") for _ in range(self.num_columns)])
+            self.rows.append(row)
+
+    def append(self, row):
+        """Store a row in the ring buffer, overwriting the oldest one when full. No widgets are touched."""
+        self.values[self.head] = row
+        self.head = (self.head + 1) % self.max_rows
+        self.count = min(self.count + 1, self.max_rows)
+        self.dirty = True
+
+    def clear(self):
+        """Drop all buffered rows."""
+        self.head = 0
+        self.count = 0
+        self.dirty = True
+
+    def render(self):
+        """Push buffered rows into the pre-created widgets, oldest first, updating only changed cells."""
+        if not self.dirty or not self.rows:
+            return
+        self.dirty = False
+
+        # Oldest row sits `count` slots behind the write head
+        order = (np.arange(self.count) + self.head - self.count) % self.max_rows
+        ordered = self.values[order]
+
+        for i in range(self.count):
+            row_values = ordered[i]
+            changed = np.nonzero(row_values != self.shown[i])[0]
+            for col in changed:
+                dpg.set_value(self.cells[i][col], row_values[col])
+            self.shown[i] = row_values
+
+        # Show or hide pooled rows only when the filled count changes
+        if self.count != self.visible_rows:
+            for i in range(min(self.count, self.visible_rows), max(self.count, self.visible_rows)):
+                dpg.configure_item(self.rows[i], show=i < self.count)
+            self.visible_rows = self.count
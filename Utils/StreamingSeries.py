@@ -0,0 +1,64 @@
+import threading
+import dearpygui.dearpygui as dpg
+import numpy as np
+from Utils.Decimation import minmax_decimate
+
+
+class StreamingLineSeries:
+    """Feeds a DearPyGui line series from a preallocated NumPy ring buffer.
+
+    append() may run on a receiver thread for every sample while flush() runs once per frame on the UI thread.
+    """
+
+    def __init__(self, series_tag, capacity=200000, lookback=None, max_points=2000):
+        self.series_tag = series_tag
+        self.capacity = capacity
+        self.lookback = lookback  # Seconds of history to plot, None for everything buffered
+        self.max_points = max_points  # Decimation target when the plot width is unknown
+
+        # Every sample is written twice, capacity apart, so the live window is always one contiguous slice
+        self.x = np.zeros(capacity * 2, dtype=np.float64)
+        self.y = np.zeros(capacity * 2, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def append(self, x, y):
+        with self.lock:
+            head = self.head
+            self.x[head] = self.x[head + self.capacity] = x
+            self.y[head] = self.y[head + self.capacity] = y
+            self.head = (head + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+            self.dirty = True
+
+    def clear(self):
+        with self.lock:
+            self.head = 0
+            self.count = 0
+            self.dirty = True
+
+    def window(self):
+        """Views (no copy) of the buffered samples inside the lookback, oldest first."""
+        start = self.head - self.count + self.capacity
+        x = self.x[start:start + self.count]
+        y = self.y[start:start + self.count]
+        if self.lookback is not None and self.count:
+            first = np.searchsorted(x, x[-1] - self.lookback)
+            x, y = x[first:], y[first:]
+        return x, y
+
+    def flush(self, pixel_width=None):
+        """Push the window to the series once per frame, decimated to about two points per pixel column."""
+        max_points = int(pixel_width) * 2 if pixel_width else self.max_points
+        with self.lock:
+            if not self.dirty:
+                return False
+            self.dirty = False
+            x, y = self.window()
+            # Decimation may return views of the ring buffer, so appends wait until the lists are built
+            x, y = minmax_decimate(x, y, max_points)
+            points = [x.tolist(), y.tolist()]
+        dpg.set_value(self.series_tag, points)
+        return True
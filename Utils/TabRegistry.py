@@ -0,0 +1,137 @@
+import importlib
+import sys
+import time
+import dearpygui.dearpygui as dpg
+
+
+class LazyTab:
+    """One registered tab: where its class lives, how to build it, and what it cost to load."""
+
+    def __init__(self, label, module, class_name, build, frame_callback=None):
+        self.label = label
+        self.module = module  # Dotted path, imported on first activation
+        self.class_name = class_name
+        self.build = build  # Method that creates the tab with `with dpg.tab(...)`
+        self.frame_callback = frame_callback  # Method run every frame once the tab is built
+        self.placeholder = None
+        self.tab = None
+        self.instance = None
+        self.import_ms = None
+        self.build_ms = None
+        self.modules_loaded = 0
+
+
+class TabRegistry:
+    """Tab bar whose tabs are placeholders until first selected.
+
+    Only the labels exist at startup. Selecting a tab imports its module, instantiates the class and swaps
+    the placeholder for the real tab, so heavy dependencies (fyers_apiv3, zmq, psycopg2, gnews) load when
+    the user first needs them instead of before the first frame. Import and build times are kept for report().
+    """
+
+    def __init__(self, tag="main_tab_bar", started_at=None):
+        self.tag = tag
+        self.tabs = []
+        self.frame_callbacks = []
+        self.started_at = started_at or time.perf_counter()  # perf_counter() taken at process start
+        self.first_frame_ms = None
+        self.frames = 0
+
+    def register(self, label, module, class_name, build, frame_callback=None):
+        self.tabs.append(LazyTab(label, module, class_name, build, frame_callback))
+
+    def build(self):
+        """Create the tab bar with one placeholder per registered tab. Call inside the parent container."""
+        with dpg.tab_bar(tag=self.tag, callback=self.on_tab_selected):
+            for tab in self.tabs:
+                with dpg.tab(label=tab.label) as tab.placeholder:
+                    dpg.add_text(f"⏳ Loading {tab.label}...", color=(120, 120, 120))
+
+    def placeholder_for(self, item):
+        """The unbuilt tab whose placeholder is `item` (an id or alias), if any."""
+        for tab in self.tabs:
+            if tab.tab is None and item in (tab.placeholder, dpg.get_item_alias(tab.placeholder)):
+                return tab
+        return None
+
+    def on_tab_selected(self, sender, app_data):
+        tab = self.placeholder_for(app_data)
+        if tab is not None:
+            self.load(tab)
+
+    def on_frame(self):
+        """Per-frame hook: build the initially selected tab after the first frame, then run the tabs' callbacks."""
+        self.frames += 1
+        if self.frames == 2:
+            # The first frame has been drawn with placeholders only; now load whatever tab is showing
+            self.first_frame_ms = (time.perf_counter() - self.started_at) * 1000
+            print(f"⏱️ First frame after {self.first_frame_ms:.0f} ms")
+            initial = self.placeholder_for(dpg.get_value(self.tag))
+            if initial is None and self.tabs and self.tabs[0].tab is None:
+                initial = self.tabs[0]
+            if initial is not None:
+                self.load(initial)
+        for callback in self.frame_callbacks:
+            callback()
+
+    def load(self, tab):
+        """Import, instantiate and build `tab` in place of its placeholder, then select it.
+
+        A failure at any step leaves only the placeholder, showing the error, so the render loop keeps running.
+        """
+        loaded_before = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(tab.module)
+        except Exception as e:
+            self.show_error(tab, e)
+            return
+        tab.import_ms = (time.perf_counter() - start) * 1000
+        tab.modules_loaded = len(sys.modules) - loaded_before
+
+        start = time.perf_counter()
+        existing = set(dpg.get_item_children(self.tag, 1))
+        try:
+            tab.instance = getattr(module, tab.class_name)()
+            dpg.push_container_stack(self.tag)
+            try:
+                getattr(tab.instance, tab.build)()
+            finally:
+                dpg.pop_container_stack()
+            tab.tab = next(item for item in dpg.get_item_children(self.tag, 1) if item not in existing)
+        except Exception as e:
+            # Drop whatever the build created before it failed; the placeholder stays in its slot
+            for item in dpg.get_item_children(self.tag, 1):
+                if item not in existing:
+                    dpg.delete_item(item)
+            tab.instance = tab.tab = None
+            tab.import_ms = None
+            self.show_error(tab, e)
+            return
+        # New tabs are appended; move it to the placeholder's slot before dropping the placeholder
+        dpg.move_item(tab.tab, parent=self.tag, before=tab.placeholder)
+        dpg.delete_item(tab.placeholder)
+        dpg.set_value(self.tag, tab.tab)
+        tab.build_ms = (time.perf_counter() - start) * 1000
+
+        if tab.frame_callback is not None:
+            self.frame_callbacks.append(getattr(tab.instance, tab.frame_callback))
+        print(f"📦 {tab.label}: import {tab.import_ms:.0f} ms ({tab.modules_loaded} modules), "
+              f"build {tab.build_ms:.0f} ms")
+
+    def show_error(self, tab, error):
+        print(f"❌ Could not load {tab.label}: {error}")
+        dpg.set_value(dpg.get_item_children(tab.placeholder, 1)[0], f"❌ Could not load {tab.label}: {error}")
+
+    def report(self):
+        """Startup and per-tab load times, one line each."""
+        lines = []
+        if self.first_frame_ms is not None:
+            lines.append(f"First frame: {self.first_frame_ms:.0f} ms")
+        for tab in self.tabs:
+            if tab.import_ms is None:
+                lines.append(f"{tab.label}: not loaded")
+            else:
+                lines.append(f"{tab.label}: import {tab.import_ms:.0f} ms ({tab.modules_loaded} modules), "
+                             f"build {tab.build_ms:.0f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,113 @@
+import datetime
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+
+class VirtualTable:
+    """DearPyGui table over columnar arrays that only materializes one page of rows.
+
+    A fixed pool of `page_size` rows is created once; scrolling, paging and jumping just rewrite
+    the text of those rows, so build time and widget count do not depend on the number of records.
+    """
+
+    def __init__(self, tag, columns, page_size=25, formatters=None):
+        self.tag = tag
+        self.columns = columns  # Column labels
+        self.page_size = page_size
+        self.formatters = formatters or [str] * len(columns)
+        self.data = [np.empty(0) for _ in columns]
+        self.offset = 0
+        self.rows = []
+        self.cells = []
+
+    @property
+    def num_rows(self):
+        return len(self.data[0])
+
+    def build(self):
+        """Create paging controls, the table and its row pool inside the current container."""
+        with dpg.group(horizontal=True):
+            dpg.add_button(label="<< Prev", callback=lambda: self.scroll_to(self.offset - self.page_size))
+            dpg.add_button(label="Next >>", callback=lambda: self.scroll_to(self.offset + self.page_size))
+            dpg.add_input_text(hint="Jump to timestamp (epoch or YYYY-MM-DD HH:MM)", width=300,
+                               tag=f"{self.tag}_jump", on_enter=True, callback=self.jump_from_input)
+            dpg.add_text("", tag=f"{self.tag}_status")
+
+        with dpg.group(horizontal=True):
+            with dpg.table(header_row=True, tag=self.tag, row_background=True, hideable=True, resizable=True,
+                           width=-30):
+                for label in self.columns:
+                    dpg.add_table_column(label=label, width_stretch=True)
+                for _ in range(self.page_size):
+                    with dpg.table_row(show=False) as row:
+                        self.cells.append([dpg.add_text("") for _ in self.columns])
+                    self.rows.append(row)
+            # Vertical slider acts as the scrollbar over the full record set
+            dpg.add_slider_int(tag=f"{self.tag}_scroll", vertical=True, height=self.page_size * 22, width=20,
+                               min_value=0, max_value=0, format="", callback=self.scroll_from_slider)
+
+        with dpg.handler_registry():
+            dpg.add_mouse_wheel_handler(callback=self.on_mouse_wheel)
+
+    def set_data(self, columns):
+        """Replace the records with new column arrays and show the first page."""
+        self.data = [np.asarray(column) for column in columns]
+        self.scroll_to(0)
+
+    def update_data(self, columns):
+        """Replace the records but keep the current scroll position, e.g. when live rows are appended."""
+        self.data = [np.asarray(column) for column in columns]
+        self.scroll_to(self.offset)
+
+    def refresh_from(self, row):
+        """Re-render after records from `row` on changed in place, but only if they are on the current page."""
+        if row < self.offset + self.page_size:
+            self.render()
+
+    def scroll_to(self, offset):
+        """Show the page starting at `offset`, clamped to the available records."""
+        max_offset = max(self.num_rows - self.page_size, 0)
+        self.offset = int(min(max(offset, 0), max_offset))
+        self.render()
+
+    def render(self):
+        if not self.rows:
+            return
+        end = min(self.offset + self.page_size, self.num_rows)
+        page = [column[self.offset:end] for column in self.data]
+        for i, row in enumerate(self.rows):
+            visible = i < end - self.offset
+            if visible:
+                for cell, formatter, column in zip(self.cells[i], self.formatters, page):
+                    dpg.set_value(cell, formatter(column[i]))
+            dpg.configure_item(row, show=visible)
+
+        # Slider is inverted so that dragging it down scrolls forward
+        max_offset = max(self.num_rows - self.page_size, 0)
+        dpg.configure_item(f"{self.tag}_scroll", max_value=max_offset)
+        dpg.set_value(f"{self.tag}_scroll", max_offset - self.offset)
+        first = self.offset + 1 if self.num_rows else 0
+        dpg.set_value(f"{self.tag}_status", f"Rows {first}-{end} of {self.num_rows}")
+
+    def scroll_from_slider(self, sender, app_data):
+        self.scroll_to(max(self.num_rows - self.page_size, 0) - app_data)
+
+    def on_mouse_wheel(self, sender, app_data):
+        if self.rows and dpg.is_item_hovered(self.tag):
+            self.scroll_to(self.offset - int(app_data) * 3)
+
+    def jump_to(self, value):
+        """Scroll to the first record whose first column (timestamp) is >= `value`."""
+        self.scroll_to(int(np.searchsorted(self.data[0], value)))
+
+    def jump_from_input(self, sender, app_data):
+        text = app_data.strip()
+        try:
+            value = float(text)
+        except ValueError:
+            try:
+                value = datetime.datetime.fromisoformat(text).timestamp()
+            except ValueError:
+                dpg.set_value(f"{self.tag}_status", f"Invalid timestamp: {text}")
+                return
+        self.jump_to(value)
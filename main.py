@@ -1,15 +1,13 @@
+import time
+started_at = time.perf_counter()
 import dearpygui.dearpygui as dpg
 import asyncio
-import feedparser
-from FyersAuthentication.FyersAuthWindow import open_fyers_auth_window
-from FyersData.FyersDataTab import FyersDataTab
-from PostgresData.PostgresDataTab import PostgresDataViewer
-from FyersData.RealTimeInsight import LiveDataTab
-from NewsSentiment.NewsTab import NewsTab
-from FyersData.RealTimeMarket import LiveDataTab
+from Utils.LatencyTracer import tracer
+from Utils.TabRegistry import TabRegistry
 import datetime
-# Set a custom User-Agent to prevent RSS feeds from blocking requests
-feedparser.USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+
+# Custom User-Agent to prevent RSS feeds from blocking requests
+RSS_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 
 # List of RSS feeds to fetch news from (cycled every 10 sec)
 RSS_FEEDS = [
@@ -29,10 +27,23 @@ BLOOMBERG_YELLOW = [255, 255, 0]
 BLOOMBERG_BLUE = [100, 150, 250]
 BLOOMBERG_GRAY = [120, 120, 120]
 
+def parse_feed(feed_url):
+    # feedparser is imported here, off the UI thread, so it doesn't delay the first frame
+    import feedparser
+    feedparser.USER_AGENT = RSS_USER_AGENT
+    return feedparser.parse(feed_url)
+
+
+def open_fyers_auth_window():
+    # Imports fyers_apiv3 only when the authentication window is first opened
+    from FyersAuthentication.FyersAuthWindow import open_fyers_auth_window as open_window
+    open_window()
+
+
 async def fetch_news(feed_url):
     """Fetch and parse news articles from a single RSS feed asynchronously."""
     try:
-        parsed_feed = await asyncio.to_thread(feedparser.parse, feed_url)
+        parsed_feed = await asyncio.to_thread(parse_feed, feed_url)
         news_items = []
         for entry in parsed_feed.entries:
             title = entry.get("title", "No Title").strip()
@@ -88,11 +99,14 @@ dpg.show_viewport()
 # Get updated viewport dimensions
 width = dpg.get_viewport_width()
 height = dpg.get_viewport_height()
-fyers_tab = FyersDataTab()
-postgres_viewer = PostgresDataViewer()
-realinsight = LiveDataTab()
-news_tab = NewsTab()
-real_market = LiveDataTab()
+
+# Tabs are placeholders until first selected; their modules are imported and widgets built on activation
+tabs = TabRegistry(started_at=started_at)
+tabs.register("Fyers Data", "FyersData.FyersDataTab", "FyersDataTab", "FyersTab", frame_callback="on_frame")
+tabs.register("Live Market Data", "FyersData.RealTimeMarket", "LiveDataTab", "LiveDataTabUI",
+              frame_callback="update_table")
+tabs.register("Financial News", "NewsSentiment.NewsTab", "NewsTab", "create_news_tab")
+tabs.register("PostgreSQL Viewer", "PostgresData.PostgresDataTab", "PostgresDataViewer", "create_postgres_tab")
 # News Section UI
 with dpg.window(label="News Dashboard", width=width, height=height, tag="primary", no_title_bar=True, no_resize=True,
                 no_move=True):
@@ -140,12 +154,7 @@ with dpg.window(label="News Dashboard", width=width, height=height, tag="primary
 
             # Center Column - Main Data Window
             with dpg.child_window(width=width - 200, autosize_y=True):
-                with dpg.tab_bar():
-                    fyers_tab.FyersTab()
-                    #realinsight.LiveDataTabUI()
-                    real_market.LiveDataTabUI()
-                    news_tab.create_news_tab()
-                    postgres_viewer.create_postgres_tab() # Add PostgreSQL Tab
+                tabs.build()
 
             # Right Column - Small Quick Actions
             with dpg.child_window(width=200, autosize_y=True):
@@ -162,19 +171,26 @@ with dpg.window(label="News Dashboard", width=width, height=height, tag="primary
             dpg.add_table_column(label="Title", width_stretch=True)
             dpg.add_table_column(label="Description", width_stretch=True)
 
+# Per-frame hooks, run on the main thread right before each frame is rendered
+frame_callbacks = [tabs.on_frame]
+
 # Run Async Tasks
 async def main_loop():
     """Start DearPyGui and continuously update the news in the background."""
-    await update_news(RSS_FEEDS[0])  # Fetch initial news from first feed
-    asyncio.create_task(update_news_periodically())  # Start background updates
+    # Start background updates; the first feed is fetched while the first frames render, not before them
+    asyncio.create_task(update_news_periodically())
     dpg.set_primary_window("primary", True)
     # dpg.start_dearpygui()
     # dpg.destroy_context()
     # Keep DearPyGui running while updating frames
     while dpg.is_dearpygui_running():
+        for callback in frame_callbacks:
+            callback()  # Apply live data and plot updates before drawing the frame
         dpg.render_dearpygui_frame()
+        tracer.frame_rendered()  # Close latency traces for ticks drawn in this frame
         await asyncio.sleep(0.01)  # Yield control to the event loop
 
 # Start event loop
 asyncio.run(main_loop())
+print(tabs.report())
 dpg.destroy_context()
\ No newline at end of file